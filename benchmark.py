@@ -0,0 +1,392 @@
+#!/usr/bin/env python3
+"""
+Mimic Benchmark: per-stage throughput, latency and memory of the scoring pipeline
+Usage: python benchmark.py --meetings 2000 --batch-sizes 8,32 --threads 1,4 --precisions fp32,int8
+       python benchmark.py --startup   (CLI start-up time; fails if a non-scoring path imports the ML stack)
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import itertools
+import subprocess
+import tempfile
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from src.synthetic_calendar import generate_calendar
+
+STAGES = ("tokenize", "forward", "pool", "score")
+# Entry points that must start without the ML stack; {scored} is a saved scored-results file
+STARTUP_COMMANDS = {
+    "mimic --help": ["mimic.py", "--help"],
+    "mimic --rerender": ["mimic.py", "bench@example.com", "--rerender", "{scored}"],
+    "estimate_value --help": ["estimate_value.py", "--help"],
+    "mimic_batch --help": ["mimic_batch.py", "--help"],
+    "mimic_server --help": ["mimic_server.py", "--help"]
+}
+HEAVY_MODULES = ("torch", "transformers", "onnxruntime")
+
+def parse_range(value: str) -> tuple:
+    """'2-8' -> (2, 8); '5' -> (5, 5)"""
+    low, _, high = value.partition("-")
+    return int(low), int(high or low)
+
+def parse_list(value: str, cast=str) -> List:
+    return [cast(v.strip()) for v in value.split(",") if v.strip()]
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process (None where the resource module is unavailable)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def percentile_ms(samples: List[float], q: float) -> float:
+    return float(np.percentile(samples, q) * 1000) if samples else 0.0
+
+def run_config(config: Dict[str, Any], calendar_path: str) -> Dict[str, Any]:
+    """Benchmark one model configuration (runs in its own process so peak RSS is per configuration)"""
+    from src.classifier import SimpleQwen3Classifier
+    from estimate_value import NumpyEncoder, load_calendar_data, meeting_fields
+    from mimic import MimicTool
+    from src.meeting import ingest
+
+    result: Dict[str, Any] = {"config": config}
+
+    start = time.perf_counter()
+    meetings = load_calendar_data(calendar_path)
+    result["json_load_s"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    classifier = SimpleQwen3Classifier(
+        config["model_path"],
+        precision=config["precision"],
+        backend=config["backend"],
+        intra_op_threads=config["threads"]
+    )
+    result["load_s"] = time.perf_counter() - start
+
+    fields = [meeting_fields(m) for m in meetings]
+    titles, bodies, counts = (list(col) for col in zip(*fields))
+    texts = [classifier._build_context(t, b, c) for t, b, c in fields]
+    batch_size = config["batch_size"]
+
+    # Warm up allocator and kernels on one batch
+    classifier.analyze_batch(titles[:batch_size], bodies[:batch_size], counts[:batch_size], batch_size=batch_size)
+
+    # Staged pass, mirroring SimpleQwen3Classifier._embed_uncached with a timer around each stage
+    stages = dict.fromkeys(STAGES, 0.0)
+    latencies = []
+    start_total = time.perf_counter()
+
+    t = time.perf_counter()
+    encoded = classifier.tokenizer(texts, truncation=True, max_length=classifier.max_length)
+    stages["tokenize"] += time.perf_counter() - t
+    lengths = [len(ids) for ids in encoded["input_ids"]]
+    order = sorted(range(len(texts)), key=lambda i: lengths[i])
+
+    for begin in range(0, len(order), batch_size):
+        bucket = order[begin:begin + batch_size]
+        batch_start = time.perf_counter()
+
+        t = time.perf_counter()
+        inputs = classifier.tokenizer.pad(
+            {
+                "input_ids": [encoded["input_ids"][i] for i in bucket],
+                "attention_mask": [encoded["attention_mask"][i] for i in bucket]
+            },
+            return_tensors="np"
+        )
+        stages["tokenize"] += time.perf_counter() - t
+
+        t = time.perf_counter()
+        hidden = classifier.backend.forward(inputs["input_ids"], inputs["attention_mask"])
+        stages["forward"] += time.perf_counter() - t
+
+        t = time.perf_counter()
+        embeddings = classifier._pool(hidden, inputs["attention_mask"])
+        stages["pool"] += time.perf_counter() - t
+
+        t = time.perf_counter()
+        classifier._analyses_from_embeddings(embeddings, [counts[i] for i in bucket])
+        stages["score"] += time.perf_counter() - t
+
+        latencies.append(time.perf_counter() - batch_start)
+
+    staged_s = time.perf_counter() - start_total
+    result["stages_s"] = stages
+    result["throughput_meetings_per_s"] = len(texts) / staged_s
+    result["batch_latency_ms"] = {"p50": percentile_ms(latencies, 50), "p95": percentile_ms(latencies, 95)}
+    result["per_meeting_ms"] = staged_s / len(texts) * 1000
+
+    # End to end through the public API, as the CLIs call it
+    start = time.perf_counter()
+    analyses = []
+    window = batch_size * classifier.BUCKET_WINDOW
+    for begin in range(0, len(texts), window):
+        analyses.extend(classifier.analyze_batch(
+            titles[begin:begin + window], bodies[begin:begin + window], counts[begin:begin + window],
+            batch_size=batch_size
+        ))
+    result["analyze_batch_meetings_per_s"] = len(texts) / (time.perf_counter() - start)
+
+    # Report rendering from the scored meetings
+    tool = MimicTool("bench@example.com", config["model_path"])
+    tool.classifier = classifier
+    analyzed = [
+        {"meeting": m, "score": a["score"], "category": a["category"], "reasoning": a["reasoning"], "role": "participant"}
+        for m, a in zip(ingest(meetings), analyses)
+    ]
+    # Rendered into a scratch directory so benchmarking leaves no report behind
+    with tempfile.TemporaryDirectory() as report_dir:
+        start = time.perf_counter()
+        tool.generate_html_package(analyzed, open_browser=False, output_dir=report_dir)
+        result["generate_html_package_s"] = time.perf_counter() - start
+
+    # Results serialization, as estimate_value.py writes them
+    start = time.perf_counter()
+    payload = json.dumps(
+        [{"meeting": m.get("subject"), **a, "original_data": m} for m, a in zip(meetings, analyses)],
+        cls=NumpyEncoder
+    )
+    result["json_dump_s"] = time.perf_counter() - start
+    result["json_dump_mb"] = len(payload) / (1024 * 1024)
+
+    result["meetings"] = len(texts)
+    result["padding_efficiency"] = classifier.padding_efficiency()
+    result["peak_rss_mb"] = peak_rss_mb()
+    return result
+
+def parse_importtime(stderr: str) -> tuple:
+    """(top-level module -> cumulative import ms, every imported module) from `python -X importtime` output"""
+    top_level = {}
+    imported = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        imported.append(name.strip())
+        # Nested imports are indented under the module that triggered them
+        if not name[1:].startswith(" "):
+            top_level[name.strip()] = int(cumulative) / 1000
+    return top_level, imported
+
+def startup_benchmark(tmp: str, budget_ms: float) -> List[Dict[str, Any]]:
+    """Time each STARTUP_COMMANDS entry with -X importtime and flag heavy imports or a blown budget"""
+    from src.meeting import ingest
+    from src.scored_results import save_scored
+
+    # A small saved report for --rerender, rendered in the scratch directory
+    scored = Path(tmp) / "scored.json"
+    meetings = ingest(generate_calendar(meetings=25, seed=0))
+    save_scored(scored, "bench@example.com", [
+        {"meeting": m, "score": 90.0 - i, "category": "Project Kickoff", "reasoning": "benchmark", "role": "participant"}
+        for i, m in enumerate(meetings)
+    ])
+    (Path(tmp) / "templates").symlink_to(Path(__file__).parent.absolute() / "templates")
+
+    results = []
+    for name, command in STARTUP_COMMANDS.items():
+        argv = [str(Path(__file__).parent / command[0])] + [a.format(scored=scored) for a in command[1:]]
+        start = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime"] + argv,
+            cwd=tmp, env={**os.environ, "BROWSER": "true"},
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+        )
+        wall_ms = (time.perf_counter() - start) * 1000
+        modules, imported = parse_importtime(proc.stderr)
+        heavy = sorted({m.split(".")[0] for m in imported} & set(HEAVY_MODULES))
+        slowest = sorted(modules.items(), key=lambda item: item[1], reverse=True)[:5]
+        results.append({
+            "command": name,
+            "exit_code": proc.returncode,
+            "wall_ms": wall_ms,
+            "import_ms": sum(modules.values()),
+            "heavy_imports": heavy,
+            "slowest_imports": dict(slowest),
+            "over_budget": wall_ms > budget_ms
+        })
+    return results
+
+def host_info() -> Dict[str, Any]:
+    info = {
+        "platform": platform.platform(),
+        "python": platform.python_version(),
+        "cpu_count": os.cpu_count()
+    }
+    try:
+        import torch
+        info["torch"] = torch.__version__
+    except ImportError:
+        pass
+    return info
+
+def compare(results: List[Dict], baseline_path: str, tolerance: float) -> List[str]:
+    """Configurations whose throughput dropped by more than tolerance versus a previous run"""
+    with open(baseline_path, 'r') as f:
+        baseline = {json.dumps(r["config"], sort_keys=True): r for r in json.load(f)["results"] if "error" not in r}
+    regressions = []
+    for r in results:
+        old = baseline.get(json.dumps(r["config"], sort_keys=True))
+        if not old or "error" in r:
+            continue
+        change = r["throughput_meetings_per_s"] / old["throughput_meetings_per_s"] - 1
+        if change < -tolerance:
+            regressions.append(f"{describe(r['config'])}: {change:+.0%} throughput")
+    return regressions
+
+def describe(config: Dict[str, Any]) -> str:
+    return f"{config['backend']}/{config['precision']} batch={config['batch_size']} threads={config['threads'] or 'default'}"
+
+def main():
+    parser = argparse.ArgumentParser(description="Mimic Benchmark: per-stage throughput, latency and memory")
+    parser.add_argument("--model-path", "-m", default="models/qwen3-embedding", help="Path to model directory")
+    parser.add_argument("--meetings", type=int, default=1000, help="Synthetic meetings to score (default: 1000)")
+    parser.add_argument("--seed", type=int, default=0, help="Calendar generator seed (default: 0)")
+    parser.add_argument("--subject-words", default="2-8", help="Subject length range in words (default: 2-8)")
+    parser.add_argument("--body-words", default="0-120", help="Body preview length range in words (default: 0-120)")
+    parser.add_argument("--attendees", default="1-40", help="Attendee count range (default: 1-40)")
+    parser.add_argument("--recurrence-ratio", type=float, default=0.3, help="Share of meetings that are series occurrences (default: 0.3)")
+    parser.add_argument("--calendar", help="Benchmark this calendar JSON instead of a synthetic one")
+    parser.add_argument("--write-calendar", help="Only write the synthetic calendar to this path and exit")
+    parser.add_argument("--batch-sizes", default="8,32", help="Comma-separated batch sizes (default: 8,32)")
+    parser.add_argument("--threads", default="0", help="Comma-separated intra-op thread counts, 0 = library default (default: 0)")
+    parser.add_argument("--precisions", default="fp32", help="Comma-separated precisions (default: fp32)")
+    parser.add_argument("--backends", default="torch", help="Comma-separated backends (default: torch)")
+    parser.add_argument("--output", "-o", default="output/benchmark.json", help="Results JSON (default: output/benchmark.json)")
+    parser.add_argument("--baseline", help="Previous results JSON; exit 1 if throughput regressed")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="Allowed throughput drop versus --baseline (default: 0.10)")
+    parser.add_argument("--verbose", action="store_true", help="Show model loading and report output from each run")
+    parser.add_argument("--startup", action="store_true", help="Benchmark CLI start-up instead of scoring; exit 1 if a non-scoring path imports torch/transformers")
+    parser.add_argument("--startup-budget-ms", type=float, default=1000, help="Allowed wall time per start-up command (default: 1000)")
+    # Internal: run a single configuration in this process
+    parser.add_argument("--run-config", help=argparse.SUPPRESS)
+    parser.add_argument("--result-path", help=argparse.SUPPRESS)
+
+    args = parser.parse_args()
+
+    if args.run_config:
+        result = run_config(json.loads(args.run_config), args.calendar)
+        with open(args.result_path, 'w') as f:
+            json.dump(result, f)
+        return
+
+    if args.startup:
+        with tempfile.TemporaryDirectory() as tmp:
+            print(f"🏁 Benchmarking start-up of {len(STARTUP_COMMANDS)} commands...")
+            results = startup_benchmark(tmp, args.startup_budget_ms)
+        failed = False
+        for r in results:
+            slowest = ", ".join(f"{name} {ms:.0f}ms" for name, ms in r["slowest_imports"].items())
+            print(f"   {r['command']:<24} {r['wall_ms']:>7.0f}ms wall  {r['import_ms']:>7.0f}ms imports  ({slowest})")
+            if r["exit_code"] != 0:
+                print(f"❌ {r['command']} exited with code {r['exit_code']}")
+                failed = True
+            if r["heavy_imports"]:
+                print(f"❌ {r['command']} imports {', '.join(r['heavy_imports'])}")
+                failed = True
+            if r["over_budget"]:
+                print(f"⚠️  {r['command']} took {r['wall_ms']:.0f}ms (budget {args.startup_budget_ms:.0f}ms)")
+                failed = True
+        output_path = Path(args.output)
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, 'w') as f:
+            json.dump({"generated": datetime.now().isoformat(), "host": host_info(), "startup": results}, f, indent=2)
+        print(f"💾 Results saved to {output_path}")
+        if failed:
+            sys.exit(1)
+        print("✅ All start-up paths are free of the ML stack and within budget")
+        return
+
+    calendar_params = {
+        "meetings": args.meetings,
+        "seed": args.seed,
+        "subject_words": parse_range(args.subject_words),
+        "body_words": parse_range(args.body_words),
+        "attendees": parse_range(args.attendees),
+        "recurrence_ratio": args.recurrence_ratio
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.calendar:
+            calendar_path = args.calendar
+            calendar_params = {"path": args.calendar}
+        else:
+            calendar_path = args.write_calendar or str(Path(tmp) / "calendar.json")
+            Path(calendar_path).parent.mkdir(parents=True, exist_ok=True)
+            with open(calendar_path, 'w') as f:
+                json.dump({"events": generate_calendar(**calendar_params)}, f)
+            if args.write_calendar:
+                print(f"💾 Synthetic calendar ({args.meetings} meetings) saved to {calendar_path}")
+                return
+
+        configs = [
+            {"model_path": args.model_path, "backend": backend, "precision": precision, "batch_size": batch_size, "threads": threads or None}
+            for backend, precision, batch_size, threads in itertools.product(
+                parse_list(args.backends), parse_list(args.precisions),
+                parse_list(args.batch_sizes, int), parse_list(args.threads, int)
+            )
+        ]
+
+        print(f"🏁 Benchmarking {len(configs)} configurations on {calendar_params.get('meetings', calendar_path)} meetings...")
+        results = []
+        for config in configs:
+            result_path = str(Path(tmp) / "result.json")
+            proc = subprocess.run(
+                [sys.executable, __file__, "--calendar", calendar_path, "--run-config", json.dumps(config), "--result-path", result_path],
+                stdout=None if args.verbose else subprocess.DEVNULL,
+                stderr=None if args.verbose else subprocess.PIPE,
+                text=True
+            )
+            if proc.returncode != 0:
+                error = (proc.stderr or "").strip().splitlines()[-1:] or [f"exit code {proc.returncode}"]
+                print(f"❌ {describe(config)}: {error[0]}")
+                results.append({"config": config, "error": error[0]})
+                continue
+            with open(result_path, 'r') as f:
+                result = json.load(f)
+            results.append(result)
+            stages = result["stages_s"]
+            print(
+                f"   {describe(config):<40} {result['throughput_meetings_per_s']:>8.1f} meetings/s  "
+                f"p50 {result['batch_latency_ms']['p50']:>7.1f}ms  p95 {result['batch_latency_ms']['p95']:>7.1f}ms  "
+                f"RSS {result['peak_rss_mb'] or 0:>6.0f}MB  "
+                + " ".join(f"{name} {stages[name]:.2f}s" for name in STAGES)
+            )
+
+    report = {
+        "generated": datetime.now().isoformat(),
+        "host": host_info(),
+        "calendar": calendar_params,
+        "results": results
+    }
+    output_path = Path(args.output)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(output_path, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"💾 Results saved to {output_path}")
+
+    if args.baseline:
+        regressions = compare(results, args.baseline, args.tolerance)
+        for line in regressions:
+            print(f"⚠️  Regression: {line}")
+        if regressions:
+            sys.exit(1)
+        print(f"✅ No throughput regressions beyond {args.tolerance:.0%}")
+
+    if any("error" in r for r in results):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -10,7 +10,11 @@ import time
 import argparse
 import numpy as np
 from pathlib import Path
-from src.classifier import SimpleQwen3Classifier
+from src.cli_options import add_classifier_args, classifier_options
+from src.metrics import METRICS, add_profile_args, profiling
+from src.server import ScoringClient
+from src.precision_check import check_precision, format_drift
+from src.streaming_io import NdjsonWriter, is_ndjson, iter_calendar_events
 
 class NumpyEncoder(json.JSONEncoder):
     def default(self, obj):
@@ -39,14 +43,59 @@ def load_calendar_data(path: str):
             return [data]
         raise ValueError("Could not parse calendar data. Expected list or dict with 'events' key.")
 
+def meeting_fields(meeting: dict):
+    """Subject, description and attendee count used for scoring"""
+    subject = meeting.get('subject', 'Unknown')
+    body = meeting.get('bodyPreview', '') or meeting.get('body', {}).get('content', '')
+    attendees = meeting.get('attendees', [])
+    attendee_count = len(attendees) if isinstance(attendees, list) else 0
+    return subject, body, attendee_count
+
+def score_meetings(classifier, meetings, batch_size: int):
+    """Generator pipeline: pull a window of meetings, score it in batches, yield results in input order"""
+    window_size = batch_size * classifier.BUCKET_WINDOW
+    window = []
+    
+    def flush():
+        subjects, bodies, attendee_counts = (list(col) for col in zip(*(meeting_fields(m) for m in window)))
+        analyses = classifier.analyze_batch(subjects, bodies, attendee_counts, batch_size=batch_size)
+        for meeting, subject, analysis in zip(window, subjects, analyses):
+            yield {
+                'meeting': subject,
+                'score': round(analysis['score'], 1),
+                'category': analysis['category'],
+                'confidence': round(analysis['confidence'], 2),
+                'reasoning': analysis['reasoning'],
+                'original_data': meeting
+            }
+    
+    for meeting in meetings:
+        window.append(meeting)
+        if len(window) >= window_size:
+            yield from flush()
+            window = []
+    if window:
+        yield from flush()
+
 def main():
     parser = argparse.ArgumentParser(description="Estimate meeting value using Qwen3-Embedding")
     parser.add_argument("input_file", help="Path to input JSON file containing meetings")
-    parser.add_argument("--output", "-o", help="Path to output JSON file", default=None)
+    parser.add_argument("--output", "-o", help="Path to output JSON file (.ndjson/.jsonl writes one result per line)", default=None)
     parser.add_argument("--model-path", "-m", help="Path to model directory", default="models/qwen3-embedding")
+    parser.add_argument("--batch-size", "-b", type=int, default=32, help="Number of meetings embedded per forward pass (default: 32)")
+    add_classifier_args(parser)
+    parser.add_argument("--check-precision", type=int, metavar="N", default=0, help="After scoring, compare N sampled meetings against fp32 on the raw context and report score drift")
+    parser.add_argument("--stream", action="store_true", help="Parse input incrementally and write NDJSON results as they are produced (flat memory for huge exports)")
+    parser.add_argument("--server", help="Score through a running mimic_server.py (e.g. http://127.0.0.1:8765) instead of loading the model")
+    add_profile_args(parser)
     
     args = parser.parse_args()
     
+    with profiling(args):
+        run(args)
+
+def run(args):
+    """One estimate_value.py run from parsed flags"""
     input_path = Path(args.input_file)
     if not input_path.exists():
         print(f"❌ Input file not found: {input_path}")
@@ -55,62 +104,107 @@ def main():
     if args.output:
         output_path = Path(args.output)
     else:
-        output_path = Path("output") / f"{input_path.stem}_estimated.json"
+        suffix = ".ndjson" if args.stream else ".json"
+        output_path = Path("output") / f"{input_path.stem}_estimated{suffix}"
         output_path.parent.mkdir(exist_ok=True)
         
-    model_path = Path(args.model_path)
-    if not model_path.exists():
-        # Try relative to script location
-        script_dir = Path(__file__).parent
-        model_path = script_dir / args.model_path
-        if not model_path.exists():
-            print(f"❌ Model not found at: {model_path}")
-            print("Please ensure the model is downloaded to 'models/qwen3-embedding'")
+    if args.server:
+        print(f"🛰️  Using scoring server at {args.server}...")
+        classifier = ScoringClient(args.server)
+        try:
+            classifier.health()
+        except Exception as e:
+            print(f"❌ Scoring server not reachable: {e}")
             sys.exit(1)
-            
-    print(f"🚀 Initializing Qwen3-Embedding Classifier...")
-    classifier = SimpleQwen3Classifier(str(model_path))
-    
-    print(f"📅 Loading meetings from {input_path}...")
-    meetings = load_calendar_data(str(input_path))
-    print(f"✅ Loaded {len(meetings)} meetings")
-    
-    results = []
-    print("\nProcessing meetings...")
+    else:
+        model_path = Path(args.model_path)
+        if not model_path.exists():
+            # Try relative to script location
+            script_dir = Path(__file__).parent
+            model_path = script_dir / args.model_path
+            if not model_path.exists():
+                print(f"❌ Model not found at: {model_path}")
+                print("Please ensure the model is downloaded to 'models/qwen3-embedding'")
+                sys.exit(1)
+                
+        print("🚀 Initializing Qwen3-Embedding Classifier...")
+        with METRICS.timer("model_load"):
+            # Imported here so --help and --server runs never load torch/transformers
+            from src.classifier import SimpleQwen3Classifier
+            classifier = SimpleQwen3Classifier(str(model_path), **classifier_options(args))
     
     start_total = time.time()
     
-    for i, meeting in enumerate(meetings, 1):
-        subject = meeting.get('subject', 'Unknown')
-        body = meeting.get('bodyPreview', '') or meeting.get('body', {}).get('content', '')
-        attendees = meeting.get('attendees', [])
-        attendee_count = len(attendees) if isinstance(attendees, list) else 0
-        
-        score, reasoning = classifier.estimate_value(subject, body, attendee_count)
+    if args.stream:
+        # Nothing is accumulated: meetings stream in, results stream out
+        print(f"📅 Streaming meetings from {input_path}...")
+        print("\nProcessing meetings...")
+        precision_sample = []
+        with NdjsonWriter(str(output_path), encoder_cls=NumpyEncoder) as writer:
+            for result in score_meetings(classifier, iter_calendar_events(str(input_path)), args.batch_size):
+                writer.write(result)
+                if len(precision_sample) < args.check_precision:
+                    precision_sample.append(meeting_fields(result['original_data']))
+                if writer.count % 100 == 0:
+                    sys.stdout.write(f"\rProcessed {writer.count} meetings")
+                    sys.stdout.flush()
+            total = writer.count
+        sys.stdout.write(f"\rProcessed {total} meetings")
+    else:
+        print(f"📅 Loading meetings from {input_path}...")
+        with METRICS.timer("json_load"):
+            meetings = list(iter_calendar_events(str(input_path))) if is_ndjson(str(input_path)) else load_calendar_data(str(input_path))
+        total = len(meetings)
+        print(f"✅ Loaded {total} meetings")
         
-        # Also get category
-        category, confidence = classifier.classify_meeting(subject, body, attendee_count)
+        results = []
+        print("\nProcessing meetings...")
         
-        result = {
-            'meeting': subject,
-            'score': round(score, 1),
-            'category': category,
-            'confidence': round(confidence, 2),
-            'reasoning': reasoning,
-            'original_data': meeting
-        }
-        results.append(result)
+        for result in score_meetings(classifier, meetings, args.batch_size):
+            results.append(result)
+            
+            # Progress bar
+            if len(results) % 10 == 0 or len(results) == total:
+                sys.stdout.write(f"\rProcessed {len(results)}/{total} meetings")
+                sys.stdout.flush()
         
-        # Progress bar
-        if i % 10 == 0 or i == len(meetings):
-            sys.stdout.write(f"\rProcessed {i}/{len(meetings)} meetings")
-            sys.stdout.flush()
+        precision_sample = [meeting_fields(m) for m in meetings] if args.check_precision else []
             
     elapsed = time.time() - start_total
-    print(f"\n\n✅ Completed in {elapsed:.1f}s ({elapsed/len(meetings):.3f}s per meeting)")
+    if classifier.cache:
+        print(f"\n📦 {classifier.cache.summary()}")
+    print(f"📐 Padding efficiency: {classifier.padding_efficiency():.0%} real tokens")
+    if not args.server:
+        print(f"⏱️  {classifier.timing_summary()}")
+    print(f"\n\n✅ Completed in {elapsed:.1f}s ({elapsed/max(total, 1):.3f}s per meeting)")
+    
+    context_changed = args.clean_context or args.context_tokens is not None
+    if context_changed and not args.server:
+        print(f"✂️  {classifier.context_builder.summary()}")
+    
+    if precision_sample and not args.server:
+        # The reference is always fp32 on the raw context, which the calibration was fitted on
+        label = args.precision + (" + cleaned/budgeted context" if context_changed else "")
+        if args.precision == "fp32" and not context_changed:
+            print("ℹ️  --check-precision only applies to bf16/int8 or --clean-context/--context-tokens; skipping.")
+        else:
+            print(f"\n🔬 Checking {label} score drift against fp32 on the raw context...")
+            subjects, bodies, attendee_counts = (list(col) for col in zip(*precision_sample))
+            report = check_precision(
+                str(model_path), classifier, subjects, bodies, attendee_counts,
+                sample_size=args.check_precision, batch_size=args.batch_size
+            )
+            print(f"   {format_drift(report, label)}")
     
-    with open(output_path, 'w') as f:
-        json.dump(results, f, indent=2, cls=NumpyEncoder)
+    if not args.stream:
+        with METRICS.timer("json_write"):
+            if is_ndjson(str(output_path)):
+                with NdjsonWriter(str(output_path), encoder_cls=NumpyEncoder) as writer:
+                    for result in results:
+                        writer.write(result)
+            else:
+                with open(output_path, 'w') as f:
+                    json.dump(results, f, indent=2, cls=NumpyEncoder)
         
     print(f"💾 Results saved to {output_path}")
 
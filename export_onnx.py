@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Export Qwen3-Embedding to ONNX for the onnx inference backend
+Usage: python export_onnx.py [--verify calendar.json]
+"""
+
+import sys
+import time
+import argparse
+from pathlib import Path
+from src.backends import default_onnx_path, export_onnx
+from src.classifier import SimpleQwen3Classifier
+from src.precision_check import precision_drift
+
+SAMPLE_MEETINGS = [
+    ("Weekly sync", "Status updates from each workstream", 6),
+    ("FY27 Strategy Roadmap Review", "Review the fiscal year roadmap with the leadership team", 24),
+    ("1:1 catch up", None, 2),
+    ("Product launch go/no-go", "Final readiness check before the public launch", 40),
+    ("Team happy hour", "Drinks on the terrace", 15),
+    ("Quarterly Business Review", "Q3 metrics, pipeline and goals", 30),
+    ("Hiring committee debrief", "Discuss candidates for the senior PM role", 5),
+    ("Budget planning", "Allocate headcount and opex across teams", 8),
+]
+
+def benchmark(classifier, titles, descriptions, counts, batch_size):
+    """Score once to warm up, then time a second pass"""
+    classifier.analyze_batch(titles, descriptions, counts, batch_size=batch_size)
+    start = time.time()
+    results = classifier.analyze_batch(titles, descriptions, counts, batch_size=batch_size)
+    return results, time.time() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="Export Qwen3-Embedding to ONNX")
+    parser.add_argument("--model-path", "-m", help="Path to model directory", default="models/qwen3-embedding")
+    parser.add_argument("--output", "-o", help="ONNX file to write (default: <model-path>/onnx/model.onnx)", default=None)
+    parser.add_argument("--opset", type=int, default=17, help="ONNX opset version (default: 17)")
+    parser.add_argument("--no-optimize", action="store_true", help="Skip ONNX Runtime offline graph optimization")
+    parser.add_argument("--verify", nargs="?", const="", metavar="CALENDAR_JSON", help="Compare scores and speed against the torch backend (optionally on a calendar file)")
+    parser.add_argument("--threads", type=int, default=None, help="Intra-op threads for both backends during --verify")
+    
+    args = parser.parse_args()
+    
+    model_path = Path(args.model_path)
+    if not model_path.exists():
+        print(f"❌ Model not found at: {model_path}")
+        print("Please run 'python download_model.py' first.")
+        sys.exit(1)
+    
+    output = Path(args.output) if args.output else default_onnx_path(str(model_path))
+    print(f"📦 Exporting {model_path} to {output}...")
+    start = time.time()
+    export_onnx(str(model_path), str(output), opset=args.opset, optimize=not args.no_optimize)
+    print(f"✅ Exported in {time.time() - start:.1f}s")
+    
+    if args.verify is None:
+        return
+    
+    if args.verify:
+        from estimate_value import load_calendar_data
+        meetings = load_calendar_data(args.verify)
+        titles = [m.get('subject', 'Unknown') for m in meetings]
+        descriptions = [m.get('bodyPreview', '') for m in meetings]
+        counts = [len(m.get('attendees', []) or []) for m in meetings]
+    else:
+        titles, descriptions, counts = (list(col) for col in zip(*SAMPLE_MEETINGS))
+    
+    print(f"\n🔬 Verifying against torch on {len(titles)} meetings...")
+    torch_clf = SimpleQwen3Classifier(str(model_path), backend="torch", intra_op_threads=args.threads)
+    onnx_clf = SimpleQwen3Classifier(str(model_path), backend="onnx", onnx_path=str(output), intra_op_threads=args.threads)
+    
+    torch_results, torch_time = benchmark(torch_clf, titles, descriptions, counts, 32)
+    onnx_results, onnx_time = benchmark(onnx_clf, titles, descriptions, counts, 32)
+    report = precision_drift(torch_results, onnx_results)
+    
+    print(f"   torch: {torch_time:.2f}s ({len(titles) / torch_time:.1f} meetings/s)")
+    print(f"   onnx:  {onnx_time:.2f}s ({len(titles) / onnx_time:.1f} meetings/s)")
+    print(f"   max |Δscore| {report['max_abs_drift']:.3f}, category agreement {report['category_agreement']:.0%}")
+
+if __name__ == "__main__":
+    main()
@@ -10,27 +10,65 @@ import sys
 import json
 import time
 import argparse
-import requests
 import webbrowser
 import platform
 import os
+import queue
+import importlib.util
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
-import numpy as np
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Any
+
+# numpy, requests and the classifier (torch/transformers) are imported where they are first needed,
+# so --help, --rerender and fetch-only work start without them
+if TYPE_CHECKING:
+    import requests
 
-# Import the classifier
 try:
-    from src.classifier import SimpleQwen3Classifier
+    from src.cli_options import add_classifier_args, classifier_options
+    from src.event_store import EventStore
+    from src.meeting import Meeting, ingest
+    from src.metrics import METRICS, add_profile_args, profiling
+    from src.prefilter import MeetingPrefilter, add_prefilter_args, prefilter_options
+    from src.scored_results import load_scored, save_scored, scored_path
+    from src.token_cache import DEFAULT_TOKEN_CACHE, add_auth_args, auth_options, load_token_cache, save_token_cache
+    from src.server import ScoringClient
+    from src.top_k import TopK
 except ImportError:
     # Handle case where script is run from different directory
     sys.path.append(str(Path(__file__).parent))
-    from src.classifier import SimpleQwen3Classifier
+    from src.cli_options import add_classifier_args, classifier_options
+    from src.event_store import EventStore
+    from src.meeting import Meeting, ingest
+    from src.metrics import METRICS, add_profile_args, profiling
+    from src.prefilter import MeetingPrefilter, add_prefilter_args, prefilter_options
+    from src.scored_results import load_scored, save_scored, scored_path
+    from src.token_cache import DEFAULT_TOKEN_CACHE, add_auth_args, auth_options, load_token_cache, save_token_cache
+    from src.server import ScoringClient
+    from src.top_k import TopK
 
 # --- Configuration ---
 CLIENT_ID = "04b07795-8ddb-461a-bbee-02f9e1bf7b46"  # Microsoft Graph Graph Explorer ID (public)
 TENANT_ID = "common"
-GRAPH_ENDPOINT = "https://graph.microsoft.com/v1.0"
+DEFAULT_AUTHORITY = f"https://login.microsoftonline.com/{TENANT_ID}"
+# Overridable so a local stub token endpoint can stand in for Entra ID (MSAL needs it served over HTTPS)
+AUTHORITY = os.environ.get("MIMIC_AUTHORITY", DEFAULT_AUTHORITY).rstrip("/")
+# MSAL adds offline_access (the refresh token) itself
+GRAPH_SCOPES = ["https://graph.microsoft.com/.default"]
+# Overridable so a local stub server can stand in for Graph
+GRAPH_ENDPOINT = os.environ.get("MIMIC_GRAPH_ENDPOINT", "https://graph.microsoft.com/v1.0")
+GRAPH_MAX_RETRIES = 5
+# Incremental sync keeps a delta window this far into the future so daily runs can reuse the token
+DELTA_LOOKAHEAD_DAYS = 30
+# Report layout: top real meetings plus the next-best candidates
+REPORT_TOP_REAL = 5
+REPORT_CANDIDATES = 15
+REPORT_MEETINGS = REPORT_TOP_REAL + REPORT_CANDIDATES
+# Graph pages buffered between the fetch threads and the scorer; fetching pauses when it is full
+PAGE_QUEUE_SIZE = 16
 
 # --- Templates (from generate_personal_devui_package.py) ---
 MEETING_TYPE_TEMPLATES = {
@@ -328,6 +366,7 @@ SYNTHETIC_SCENARIOS = [
 
 class NumpyEncoder(json.JSONEncoder):
     def default(self, obj):
+        import numpy as np
         if isinstance(obj, np.integer):
             return int(obj)
         if isinstance(obj, np.floating):
@@ -336,87 +375,146 @@ class NumpyEncoder(json.JSONEncoder):
             return obj.tolist()
         return super(NumpyEncoder, self).default(obj)
 
+def has_rich_metadata(meeting: Meeting) -> bool:
+    """Only meetings with attendees and a subject can be shown in the report"""
+    return meeting.attendee_count >= 2 and bool(meeting.subject)
+
 class MimicTool:
-    def __init__(self, user_email: str, model_path: str = "models/qwen3-embedding"):
+    def __init__(
+        self,
+        user_email: str,
+        model_path: str = "models/qwen3-embedding",
+        server_url: Optional[str] = None,
+        classifier_options: Optional[Dict[str, Any]] = None,
+        calendar_path: str = "me",
+        prefilter_options: Optional[Dict[str, Any]] = None,
+        token_cache_path: str = DEFAULT_TOKEN_CACHE,
+        account: Optional[str] = None,
+        interactive: bool = True
+    ):
         self.user_email = user_email
         self.model_path = model_path
+        self.server_url = server_url
+        # Keyword arguments for SimpleQwen3Classifier (cache, pooling, precision, backend, threads)
+        self.classifier_options = classifier_options or {"cache_path": "cache/embeddings.sqlite"}
         self.access_token = None
         self.classifier = None
+        self.fetched_count = 0
+        self.analyzed_count = 0
+        # Keyword arguments for MeetingPrefilter (rules, series dedup)
+        self.prefilter_options = prefilter_options or {}
+        self.prefilter = None
+        self.graph_endpoint = GRAPH_ENDPOINT
+        self.authority = AUTHORITY
+        # Tokens persist here (0600) so later runs sign in silently
+        self.token_cache_path = token_cache_path
+        # Only this account's cached tokens are used, so a shared cache never signs in as someone else
+        self.account = account or user_email
+        # Scheduled runs fail instead of waiting for a sign-in nobody will complete
+        self.interactive = interactive
+        # "me" for the signed-in user, "users/<email>" to read a calendar shared with them
+        self.calendar_path = calendar_path
+        self._session = None
+        self._loader: Optional[threading.Thread] = None
+        self._load_failed = False
         
     def authenticate(self):
-        """Authenticate user based on platform"""
-        system = platform.system()
+        """Sign in silently from the token cache, else interactively (Windows) or via device code"""
+        with METRICS.timer("auth"):
+            # Only checks that MSAL is installed; authenticate_msal imports it
+            if importlib.util.find_spec("msal") is None:
+                print("⚠️ MSAL not installed. Tokens will not be cached between runs.")
+                if not self.interactive:
+                    print("❌ Interactive sign-in is disabled.")
+                    return False
+                return self.authenticate_device_flow()
+            return self.authenticate_msal()
+
+    def authenticate_msal(self):
+        """
+        Authenticate with MSAL and a persistent token cache
+        A cached account is refreshed silently with its refresh token; only when that fails does
+        the user sign in again (interactive login on Windows, device code flow elsewhere)
+        """
+        import msal
         
-        if system == "Windows":
-            return self.authenticate_windows()
-        else:
-            return self.authenticate_device_flow()
-
-    def authenticate_windows(self):
-        """Authenticate using MSAL on Windows (supports SSO/Broker)"""
-        print("\n🔐 Authenticating via Windows (MSAL)...")
-        try:
-            import msal
-        except ImportError:
-            print("⚠️ MSAL not installed. Falling back to Device Code Flow.")
-            return self.authenticate_device_flow()
-
-        # Cache setup
-        cache = msal.SerializableTokenCache()
-        cache_file = Path("token_cache.bin")
-        if cache_file.exists():
-            try:
-                cache.deserialize(open(cache_file, "r").read())
-            except:
-                pass
-
-        # Setup App
+        cache = load_token_cache(self.token_cache_path)
         app = msal.PublicClientApplication(
             CLIENT_ID,
-            authority=f"https://login.microsoftonline.com/{TENANT_ID}",
-            token_cache=cache
+            authority=self.authority,
+            token_cache=cache,
+            # A stub authority is unknown to Microsoft's instance discovery
+            instance_discovery=None if self.authority == DEFAULT_AUTHORITY else False
         )
         
-        scopes = ["https://graph.microsoft.com/.default", "offline_access"]
+        # 1. Try Silent (Cached access token, or refresh token)
         result = None
-        
-        # 1. Try Silent (Cached)
-        accounts = app.get_accounts()
+        accounts = app.get_accounts(username=self.account)
         if accounts:
-            print(f"   Found account: {accounts[0]['username']}")
-            result = app.acquire_token_silent(scopes, account=accounts[0])
+            print(f"\n🔐 Signing in as {accounts[0]['username']} from the token cache...")
+            result = app.acquire_token_silent(GRAPH_SCOPES, account=accounts[0])
             
-        # 2. Try Interactive
-        if not result:
-            print("   No silent token found. Launching interactive login...")
+        if not result and not self.interactive:
+            print(f"❌ No cached sign-in for {self.account} could be refreshed and interactive sign-in is disabled.")
+            return False
+            
+        # 2. Try Interactive (Windows SSO/Broker)
+        if not result and platform.system() == "Windows":
+            print("\n🔐 Authenticating via Windows (MSAL)...")
             try:
-                result = app.acquire_token_interactive(scopes=scopes)
+                result = app.acquire_token_interactive(scopes=GRAPH_SCOPES)
             except Exception as e:
                 print(f"❌ Interactive auth failed: {e}")
+            if not result or "access_token" not in result:
+                print("⚠️ Windows auth failed or cancelled. Falling back to Device Code Flow.")
+                result = None
                 
+        # 3. Device Code Flow
+        if not result:
+            result = self._msal_device_flow(app)
+            
+        save_token_cache(cache, self.token_cache_path)
         if result and "access_token" in result:
             self.access_token = result["access_token"]
             print("✅ Authentication successful!")
-            # Save cache
-            if cache.has_state_changed:
-                with open(cache_file, "w") as f:
-                    f.write(cache.serialize())
             return True
-        else:
-            print("⚠️ Windows auth failed or cancelled. Falling back to Device Code Flow.")
-            return self.authenticate_device_flow()
+        print(f"❌ Auth error: {(result or {}).get('error_description', 'no token returned')}")
+        return False
+
+    def _msal_device_flow(self, app) -> Optional[Dict]:
+        """Device code sign-in through MSAL; the tokens land in the app's cache"""
+        print("\n🔐 Authenticating with Microsoft Graph (Device Flow)...")
+        flow = app.initiate_device_flow(scopes=GRAPH_SCOPES)
+        if "user_code" not in flow:
+            print(f"❌ Failed to initiate authentication: {flow.get('error_description', flow)}")
+            return None
+            
+        print(f"\n📱 Please visit: {flow['verification_uri']}")
+        print(f"🔑 Enter code: {flow['user_code']}")
+        
+        # Try to open browser
+        try:
+            webbrowser.open(flow['verification_uri'])
+        except:
+            pass
+            
+        print("\n⏳ Waiting for you to sign in...")
+        # Polls the token endpoint at the interval the server asks for, until the code expires
+        return app.acquire_token_by_device_flow(flow)
 
     def authenticate_device_flow(self):
-        """Authenticate using Device Code Flow"""
+        """Authenticate using Device Code Flow without MSAL (tokens are not cached)"""
         print("\n🔐 Authenticating with Microsoft Graph (Device Flow)...")
         
         # 1. Get Device Code
-        url = f"https://login.microsoftonline.com/{TENANT_ID}/oauth2/v2.0/devicecode"
+        url = f"{self.authority}/oauth2/v2.0/devicecode"
         data = {
             "client_id": CLIENT_ID,
             "scope": "https://graph.microsoft.com/.default offline_access"
         }
         
+        import requests
+        
         try:
             response = requests.post(url, data=data)
             response.raise_for_status()
@@ -441,7 +539,7 @@ class MimicTool:
         expires_in = device_auth.get('expires_in', 900)
         start_time = time.time()
         
-        token_url = f"https://login.microsoftonline.com/{TENANT_ID}/oauth2/v2.0/token"
+        token_url = f"{self.authority}/oauth2/v2.0/token"
         token_data = {
             "grant_type": "urn:ietf:params:oauth:grant-type:device_code",
             "client_id": CLIENT_ID,
@@ -470,118 +568,434 @@ class MimicTool:
         print("❌ Authentication timed out.")
         return False
 
-    def fetch_meetings(self, days: int = 180) -> List[Dict]:
-        """Fetch calendar events for the last N days"""
+    def _graph_session(self, pool_size: int) -> "requests.Session":
+        """Pooled HTTP session shared by all Graph requests"""
+        import requests
+        
+        if self._session is None:
+            self._session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            self._session.mount("https://", adapter)
+            self._session.mount("http://", adapter)
+        return self._session
+
+    def _graph_get(self, session: "requests.Session", url: str, headers: Dict, params: Optional[Dict] = None) -> Dict:
+        """GET a Graph page, honoring 429/503 throttling via Retry-After"""
+        for attempt in range(GRAPH_MAX_RETRIES + 1):
+            with METRICS.timer("graph_request"):
+                resp = session.get(url, headers=headers, params=params, timeout=60)
+            if resp.status_code in (429, 503, 504) and attempt < GRAPH_MAX_RETRIES:
+                retry_after = resp.headers.get("Retry-After", "")
+                delay = float(retry_after) if retry_after.isdigit() else 2 ** attempt
+                METRICS.count("graph_throttled")
+                with METRICS.timer("graph_backoff"):
+                    time.sleep(delay)
+                continue
+            resp.raise_for_status()
+            METRICS.count("graph_pages")
+            return resp.json()
+
+    def _fetch_window(
+        self,
+        session: "requests.Session",
+        headers: Dict,
+        window_start: datetime,
+        window_end: datetime,
+        range_end: datetime,
+        on_page=None
+    ) -> List[Dict]:
+        """Fetch all pages of events starting inside one time window"""
+        events = []
+        url = f"{self.graph_endpoint}/{self.calendar_path}/calendar/events"
+        # Shard on start time only, so events crossing a window boundary land in exactly one window
+        params = {
+            "$filter": (
+                f"start/dateTime ge '{window_start.isoformat()}' and start/dateTime lt '{window_end.isoformat()}'"
+                f" and end/dateTime le '{range_end.isoformat()}'"
+            ),
+            "$select": "id,subject,bodyPreview,start,end,attendees,organizer,location,isCancelled,isAllDay,showAs,responseStatus,seriesMasterId,type",
+            "$top": 100
+        }
+        
+        while url:
+            data = self._graph_get(session, url, headers, params)
+            batch = data.get('value', [])
+            events.extend(batch)
+            if on_page:
+                on_page(batch)
+            url = data.get('@odata.nextLink')
+            params = None # params only needed for first request
+            
+        return events
+
+    def _time_windows(self, days: int, window_days: int):
+        """Consecutive (start, end) windows covering the last N days, and the range end"""
+        end_date = datetime.utcnow()
+        start_date = end_date - timedelta(days=days)
+        windows = []
+        window_start = start_date
+        while window_start < end_date:
+            window_end = min(window_start + timedelta(days=window_days), end_date)
+            # The last window includes events starting exactly at end_date
+            if window_end == end_date:
+                window_end += timedelta(seconds=1)
+            windows.append((window_start, window_end))
+            window_start = window_end
+        return windows, end_date
+
+    def _fetch_headers(self) -> Dict:
+        return {
+            "Authorization": f"Bearer {self.access_token}",
+            "Prefer": 'outlook.timezone="UTC"'
+        }
+
+    def fetch_meetings(self, days: int = 180, workers: int = 4, window_days: int = 30) -> List[Meeting]:
+        """Fetch calendar events for the last N days, time windows in parallel"""
         if not self.access_token:
             print("❌ Not authenticated.")
             return []
             
         print(f"\n📅 Fetching calendar data for last {days} days...")
         
+        windows, end_date = self._time_windows(days, window_days)
+        headers = self._fetch_headers()
+        session = self._graph_session(workers)
+        progress_lock = threading.Lock()
+        fetched = [0]
+        
+        def on_page(batch):
+            with progress_lock:
+                fetched[0] += len(batch)
+                print(f"   Fetched {fetched[0]} events...", end='\r')
+        
+        events = []
+        seen_ids = set()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(self._fetch_window, session, headers, ws, we, end_date, on_page)
+                for ws, we in windows
+            ]
+            for future in futures:
+                try:
+                    window_events = future.result()
+                except Exception as e:
+                    print(f"\n❌ Error fetching events: {e}")
+                    continue
+                for event in window_events:
+                    # Graph can return the same event from adjacent pages or windows
+                    event_id = event.get('id')
+                    if event_id:
+                        if event_id in seen_ids:
+                            continue
+                        seen_ids.add(event_id)
+                    events.append(event)
+                
+        print(f"\n✅ Total events fetched: {len(events)} ({len(windows)} windows, {workers} workers)")
+        return ingest(events)
+
+    def stream_meetings(self, days: int = 180, workers: int = 4, window_days: int = 30) -> Iterator[List[Meeting]]:
+        """
+        Like fetch_meetings, but yields each Graph page as soon as it arrives (pages of different
+        windows interleave); at most PAGE_QUEUE_SIZE pages wait for the consumer
+        """
+        if not self.access_token:
+            print("❌ Not authenticated.")
+            return
+            
+        print(f"\n📅 Streaming calendar data for last {days} days...")
+        
+        windows, end_date = self._time_windows(days, window_days)
+        headers = self._fetch_headers()
+        session = self._graph_session(workers)
+        pages: queue.Queue = queue.Queue(maxsize=PAGE_QUEUE_SIZE)
+        stop = threading.Event()
+        window_done = object()
+        
+        def put_page(batch):
+            if stop.is_set():
+                raise InterruptedError("Consumer stopped")
+            pages.put(batch)
+        
+        def fetch_window(window_start, window_end):
+            try:
+                self._fetch_window(session, headers, window_start, window_end, end_date, put_page)
+            except InterruptedError:
+                pass
+            except Exception as e:
+                print(f"\n❌ Error fetching events: {e}")
+            finally:
+                pages.put(window_done)
+        
+        fetched = 0
+        seen_ids = set()
+        remaining = len(windows)
+        pool = ThreadPoolExecutor(max_workers=workers)
+        try:
+            for window_start, window_end in windows:
+                pool.submit(fetch_window, window_start, window_end)
+            while remaining:
+                batch = pages.get()
+                if batch is window_done:
+                    remaining -= 1
+                    continue
+                # Graph can return the same event from adjacent pages or windows
+                page = []
+                for event in batch:
+                    event_id = event.get('id')
+                    if event_id:
+                        if event_id in seen_ids:
+                            continue
+                        seen_ids.add(event_id)
+                    page.append(event)
+                fetched += len(page)
+                yield ingest(page)
+        finally:
+            # Unblock fetch threads waiting on a full queue if the consumer stopped early
+            stop.set()
+            while remaining:
+                if pages.get() is window_done:
+                    remaining -= 1
+            pool.shutdown()
+            
+        print(f"\n✅ Total events fetched: {fetched} ({len(windows)} windows, {workers} workers)")
+
+    def sync_meetings(self, days: int = 180, store_path: str = "cache/events.sqlite") -> List[Meeting]:
+        """
+        Incrementally sync calendar events via calendarView/delta into a local store
+        The first run downloads the whole window; later runs only transfer added, changed or deleted events
+        """
+        import requests
+        
+        if not self.access_token:
+            print("❌ Not authenticated.")
+            return []
+            
         end_date = datetime.utcnow()
         start_date = end_date - timedelta(days=days)
         
+        store = EventStore(store_path)
+        state = store.get_state()
+        
+        # A delta token is bound to the window it was created with; start over when it no longer covers the range
+        reusable = (
+            state is not None
+            and state.get("user") == self.user_email.lower()
+            and state["window_start"] <= start_date.isoformat()
+            and state["window_end"] >= end_date.isoformat()
+        )
+        
         headers = {
             "Authorization": f"Bearer {self.access_token}",
-            "Prefer": 'outlook.timezone="UTC"'
+            "Prefer": 'outlook.timezone="UTC", odata.maxpagesize=100'
         }
+        session = self._graph_session(1)
         
-        events = []
-        url = f"{GRAPH_ENDPOINT}/me/calendar/events"
-        params = {
-            "$filter": f"start/dateTime ge '{start_date.isoformat()}' and end/dateTime le '{end_date.isoformat()}'",
-            "$select": "subject,bodyPreview,start,end,attendees,organizer,location",
-            "$top": 100
-        }
+        def initial_request():
+            window_end = end_date + timedelta(days=DELTA_LOOKAHEAD_DAYS)
+            url = (
+                f"{self.graph_endpoint}/{self.calendar_path}/calendarView/delta"
+                f"?startDateTime={start_date.isoformat()}&endDateTime={window_end.isoformat()}"
+            )
+            return url, {"user": self.user_email.lower(), "window_start": start_date.isoformat(), "window_end": window_end.isoformat()}
+        
+        if reusable:
+            print(f"\n🔄 Syncing calendar changes since last run ({store.count()} events stored)...")
+            url, new_state = state["delta_link"], dict(state)
+        else:
+            print(f"\n📅 Initial calendar sync for last {days} days...")
+            url, new_state = initial_request()
         
+        upserts, deleted = [], []
         while url:
             try:
-                resp = requests.get(url, headers=headers, params=params)
-                resp.raise_for_status()
-                data = resp.json()
-                
-                batch = data.get('value', [])
-                events.extend(batch)
-                print(f"   Fetched {len(events)} events...", end='\r')
-                
-                url = data.get('@odata.nextLink')
-                params = None # params only needed for first request
-            except Exception as e:
-                print(f"\n❌ Error fetching events: {e}")
-                break
+                data = self._graph_get(session, url, headers)
+            except requests.HTTPError as e:
+                if reusable and e.response is not None and e.response.status_code == 410:
+                    # Delta token expired: fall back to a full sync
+                    print("\n⚠️ Delta token expired. Running a full sync...")
+                    reusable = False
+                    url, new_state = initial_request()
+                    upserts, deleted = [], []
+                    continue
+                print(f"\n❌ Error syncing events: {e}")
+                store.close()
+                return []
                 
-        print(f"\n✅ Total events fetched: {len(events)}")
-        return events
+            for event in data.get('value', []):
+                if '@removed' in event:
+                    deleted.append(event['id'])
+                else:
+                    upserts.append(event)
+            print(f"   Received {len(upserts)} changed, {len(deleted)} removed...", end='\r')
+            
+            url = data.get('@odata.nextLink')
+            if data.get('@odata.deltaLink'):
+                new_state["delta_link"] = data['@odata.deltaLink']
+        
+        store.apply_sync(upserts, deleted, new_state, reset=not reusable)
+        events = store.events_between(start_date.isoformat(), end_date.isoformat())
+        store.close()
+        
+        print(f"\n✅ Sync complete: {len(upserts)} added/changed, {len(deleted)} removed, {len(events)} events in range")
+        return ingest(events)
 
     def load_classifier(self):
-        """Load the Qwen3-Embedding classifier"""
+        """Load the Qwen3-Embedding classifier (or connect to a running scoring server)"""
+        if self.server_url:
+            print(f"\n🛰️  Using scoring server at {self.server_url}...")
+            try:
+                self.classifier = ScoringClient(self.server_url)
+                self.classifier.health()
+                print("✅ Scoring server reachable.")
+            except Exception as e:
+                print(f"❌ Scoring server not reachable: {e}")
+                sys.exit(1)
+            return
+            
         print("\n🚀 Loading AI Model (Qwen3-Embedding)...")
         try:
-            self.classifier = SimpleQwen3Classifier(self.model_path)
+            from src.classifier import SimpleQwen3Classifier
+
+            self.classifier = SimpleQwen3Classifier(self.model_path, **self.classifier_options)
             print("✅ Model loaded successfully.")
         except Exception as e:
             print(f"❌ Failed to load model: {e}")
             sys.exit(1)
 
-    def process_meetings(self, meetings: List[Dict]) -> List[Dict]:
-        """Classify and estimate value for all meetings"""
+    def load_classifier_async(self):
+        """Start loading the classifier in a background thread; scoring waits for it to finish"""
+        def load():
+            with METRICS.timer("model_load"):
+                try:
+                    self.load_classifier()
+                except SystemExit:
+                    self._load_failed = True
+        
+        self._loader = threading.Thread(target=load, name="model-load", daemon=True)
+        self._loader.start()
+
+    def _wait_for_classifier(self):
+        """Block until the classifier is ready, loading it now if no background load was started"""
+        if self._loader is not None:
+            with METRICS.timer("model_wait"):
+                self._loader.join()
+            self._loader = None
+            if self._load_failed:
+                sys.exit(1)
         if not self.classifier:
-            self.load_classifier()
-            
+            with METRICS.timer("model_load"):
+                self.load_classifier()
+
+    def process_meetings(self, meetings: List[Meeting], batch_size: int = 32, keep: Optional[int] = REPORT_MEETINGS) -> List[Dict]:
+        """
+        Classify and estimate value for all meetings
+        With keep set, only the `keep` best-scoring meetings the report can show are retained
+        (best first) and every other meeting's raw event is released; keep=None returns every
+        analyzed meeting in input order
+        """
+        results = self.process_pages([meetings], batch_size=batch_size, keep=keep)
+        if keep is not None:
+            # Full events are only needed for the meetings that reach the report
+            retained = {id(result['meeting']) for result in results}
+            for meeting in meetings:
+                if id(meeting) not in retained:
+                    meeting.raw = None
+        return results
+
+    def process_pages(self, pages: Iterable[List[Meeting]], batch_size: int = 32, keep: Optional[int] = REPORT_MEETINGS) -> List[Dict]:
+        """
+        Score meetings page by page as pages arrive (e.g. from stream_meetings); same results as
+        process_meetings. Meetings are scored in windows of batch_size * BUCKET_WINDOW, so fetching
+        the next pages overlaps scoring the current ones
+        """
         print("\n🤖 Analyzing meetings...")
-        results = []
-        
-        total = len(meetings)
-        for i, meeting in enumerate(meetings):
-            subject = meeting.get('subject', 'Untitled')
-            body = meeting.get('bodyPreview', '')
-            attendees = meeting.get('attendees', [])
-            attendee_count = len(attendees)
-            
-            # Skip very small meetings (optional, but good for noise reduction)
-            if attendee_count < 2:
-                continue
+        results = TopK(keep) if keep is not None else []
+        
+        # Cheap rules drop meetings that never need the model; each recurring series is scored once
+        self.prefilter = MeetingPrefilter(**self.prefilter_options)
+        user_email = self.user_email.lower()
+        total = 0
+        relevant = 0
+        pending: List[Meeting] = []
+        # Kept meetings (with the index of the analysis they share) waiting for their series to be scored
+        waiting: deque = deque()
+        analyses: List[Dict] = []
+        
+        def score(final: bool):
+            if final:
+                self._wait_for_classifier()
+            elif self.classifier is None:
+                # Keep taking pages while a background model load finishes
+                return
+            window = batch_size * self.classifier.BUCKET_WINDOW
+            while len(pending) >= window or (final and pending):
+                batch = pending[:window]
+                del pending[:window]
+                subjects = [m.subject if m.subject is not None else 'Untitled' for m in batch]
+                bodies = [m.description for m in batch]
+                attendee_counts = [m.attendee_count for m in batch]
                 
-            # 1. Estimate Value
-            score, reasoning = self.classifier.estimate_value(subject, body, attendee_count)
-            
-            # 2. Classify Category
-            category, conf = self.classifier.classify_meeting(subject, body, attendee_count)
-            
-            # Determine role
-            organizer = meeting.get('organizer', {}).get('emailAddress', {}).get('address', '').lower()
-            role = "organizer" if organizer == self.user_email.lower() else "participant"
-            
-            results.append({
-                "meeting": meeting,
-                "score": score,
-                "category": category,
-                "reasoning": reasoning,
-                "role": role
-            })
+                # Estimate value and classify from one shared embedding per meeting
+                analyses.extend(self.classifier.analyze_batch(subjects, bodies, attendee_counts, batch_size=batch_size))
+                print(f"   Scored {len(analyses)}/{self.prefilter.scored} (of {total} fetched)...", end='\r')
             
-            if i % 10 == 0:
-                print(f"   Processed {i}/{total}...", end='\r')
+            # Fan each series' score out to all of its occurrences, in input order
+            while waiting and waiting[0][1] < len(analyses):
+                meeting, index = waiting.popleft()
+                analysis = analyses[index]
+                role = "organizer" if meeting.organizer_email.lower() == user_email else "participant"
+                
+                result = {
+                    "meeting": meeting,
+                    "score": analysis['score'],
+                    "category": analysis['category'],
+                    "reasoning": analysis['reasoning'],
+                    "role": role
+                }
+                if keep is None:
+                    results.append(result)
+                elif has_rich_metadata(meeting):
+                    # Meetings the report can never show are not retained
+                    results.push(result['score'], result)
+        
+        for page in pages:
+            total += len(page)
+            with METRICS.timer("prefilter"):
+                kept, to_score, representative = self.prefilter.apply(page)
+            relevant += len(kept)
+            pending.extend(to_score)
+            waiting.extend(zip(kept, representative))
+            score(final=False)
+        score(final=True)
+        self.fetched_count = total
+        self.analyzed_count = relevant
                 
-        print(f"\n✅ Analyzed {len(results)} relevant meetings.")
+        print(f"\n✅ Analyzed {self.analyzed_count} relevant meetings with {self.prefilter.scored} model inputs.")
+        print(f"   {self.prefilter.summary()}")
+        if keep is not None:
+            print(f"   Kept the top {len(results)} of {results.seen} reportable meetings")
+            results = results.items()
+        if self.classifier.cache:
+            print(f"   {self.classifier.cache.summary()}")
+        print(f"   Padding efficiency: {self.classifier.padding_efficiency():.0%} real tokens")
+        if not self.server_url:
+            print(f"   {self.classifier.timing_summary()}")
+            if self.classifier.context_builder.clean or self.classifier.context_builder.max_tokens:
+                print(f"   {self.classifier.context_builder.summary()}")
         return results
 
-    def _create_prompt_from_meeting(self, meeting: Dict, template: Dict) -> str:
+    def _create_prompt_from_meeting(self, meeting: Meeting, template: Dict) -> str:
         """Create a grounded prompt from a real meeting using the rich template"""
-        subject = meeting.get('subject', 'Untitled')
-        start_dt = meeting.get('start', {}).get('dateTime', '')
-        attendee_count = len(meeting.get('attendees', []))
-        location = meeting.get('location', {}).get('displayName', '')
+        subject = meeting.subject if meeting.subject is not None else 'Untitled'
+        attendee_count = meeting.attendee_count
+        location = meeting.location or ''
         
         # Format date and time for unique identification
-        try:
-            # Handle various date formats (ISO with/without Z, etc)
-            clean_dt = start_dt.replace('Z', '+00:00').split('.')[0]
-            dt = datetime.fromisoformat(clean_dt)
-            date_str = dt.strftime("%B %d, %Y")
-            time_str = dt.strftime("%I:%M %p")
-            datetime_str = dt.strftime("%B %d, %Y at %I:%M %p")
-        except:
+        if meeting.start:
+            date_str = meeting.start.strftime("%B %d, %Y")
+            time_str = meeting.start.strftime("%I:%M %p")
+            datetime_str = meeting.start.strftime("%B %d, %Y at %I:%M %p")
+        else:
             date_str = "the scheduled date"
             time_str = ""
             datetime_str = "the scheduled date and time"
@@ -623,31 +1037,40 @@ Generate a comprehensive workback plan that ensures successful meeting preparati
 
         return prompt_text
 
-    def generate_html_package(self, analyzed_meetings: List[Dict]):
+    def _report_metadata(self, meeting: Meeting):
+        """Display date, location and organizer shown for a real meeting in the report"""
+        formatted_date = meeting.start.strftime("%B %d, %Y at %I:%M %p") if meeting.start else meeting.start_text
+        location = meeting.location if meeting.location is not None else 'Teams Meeting'
+        organizer_name = meeting.organizer_name if meeting.organizer_name is not None else 'Unknown'
+        organizer_email = meeting.organizer_email
+        organizer_str = f"{organizer_name} ({organizer_email})" if organizer_email else organizer_name
+        return formatted_date, location, organizer_str
+
+    def generate_html_package(
+        self,
+        analyzed_meetings: List[Dict],
+        open_browser: bool = True,
+        output_dir: str = "output"
+    ) -> Optional[Path]:
         """Generate the HTML interface with 5 Synthetic + 5 Real + 15 Candidates"""
         print("\n📦 Generating Mimic Interface...")
         
-        # 1. Sort by score (descending)
-        analyzed_meetings.sort(key=lambda x: x['score'], reverse=True)
-        
-        # 2. Select Top 5 Real High-Value (Must have rich metadata)
-        top_5_real = []
-        candidates = []
+        # 1-2. Select the highest-scoring meetings with rich metadata (attendees and subject)
+        # with a bounded heap instead of sorting everything
+        selected = TopK(REPORT_MEETINGS)
+        for m in analyzed_meetings:
+            if has_rich_metadata(m['meeting']):
+                selected.push(m['score'], m)
+        rich_meetings = selected.items()
         
-        # Filter for rich metadata (must have attendees and body/subject)
-        rich_meetings = [
-            m for m in analyzed_meetings 
-            if len(m['meeting'].get('attendees', [])) >= 2 
-            and m['meeting'].get('subject')
-        ]
-        
-        if len(rich_meetings) < 5:
-            print(f"⚠️ Warning: Only found {len(rich_meetings)} meetings with rich metadata (need 5).")
+        if len(rich_meetings) < REPORT_TOP_REAL:
+            print(f"⚠️ Warning: Only found {len(rich_meetings)} meetings with rich metadata (need {REPORT_TOP_REAL}).")
             
-        top_5_real = rich_meetings[:5]
-        candidates = rich_meetings[5:20] # Next 15
+        top_5_real = rich_meetings[:REPORT_TOP_REAL]
+        candidates = rich_meetings[REPORT_TOP_REAL:REPORT_MEETINGS] # Next 15
         
         # 4. Prepare Prompt Data
+        prompt_start = time.perf_counter()
         prompts_data = []
         prompt_id = 1
         
@@ -733,26 +1156,16 @@ Please use your imagination to create a comprehensive workback plan for this sce
             prompt_text = self._create_prompt_from_meeting(meeting, template)
             
             # Extract Rich Metadata
-            start_time = meeting.get('start', {}).get('dateTime', '')
-            try:
-                dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-                formatted_date = dt.strftime("%B %d, %Y at %I:%M %p")
-            except:
-                formatted_date = start_time
-                
-            location = meeting.get('location', {}).get('displayName', 'Teams Meeting')
-            organizer_name = meeting.get('organizer', {}).get('emailAddress', {}).get('name', 'Unknown')
-            organizer_email = meeting.get('organizer', {}).get('emailAddress', {}).get('address', '')
-            organizer_str = f"{organizer_name} ({organizer_email})" if organizer_email else organizer_name
+            formatted_date, location, organizer_str = self._report_metadata(meeting)
 
             prompts_data.append({
                 "id": prompt_id,
-                "title": meeting.get('subject'),
+                "title": meeting.subject,
                 "category": category,
                 "complexity": template.get('complexity', 'medium'),
                 "leadTime": template.get('leadTime', 14),
-                "description": meeting.get('bodyPreview', '')[:200] + "...",
-                "attendees": len(meeting.get('attendees', [])),
+                "description": meeting.description[:200] + "...",
+                "attendees": meeting.attendee_count,
                 "userRole": item['role'],
                 "valueScore": item['score'],
                 "reasoning": item['reasoning'],
@@ -779,26 +1192,16 @@ Please use your imagination to create a comprehensive workback plan for this sce
             prompt_text = self._create_prompt_from_meeting(meeting, template)
             
             # Extract Rich Metadata
-            start_time = meeting.get('start', {}).get('dateTime', '')
-            try:
-                dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
-                formatted_date = dt.strftime("%B %d, %Y at %I:%M %p")
-            except:
-                formatted_date = start_time
-                
-            location = meeting.get('location', {}).get('displayName', 'Teams Meeting')
-            organizer_name = meeting.get('organizer', {}).get('emailAddress', {}).get('name', 'Unknown')
-            organizer_email = meeting.get('organizer', {}).get('emailAddress', {}).get('address', '')
-            organizer_str = f"{organizer_name} ({organizer_email})" if organizer_email else organizer_name
+            formatted_date, location, organizer_str = self._report_metadata(meeting)
             
             prompts_data.append({
                 "id": prompt_id,
-                "title": meeting.get('subject'),
+                "title": meeting.subject,
                 "category": category,
                 "complexity": template.get('complexity', 'medium'),
                 "leadTime": template.get('leadTime', 14),
-                "description": meeting.get('bodyPreview', '')[:200] + "...",
-                "attendees": len(meeting.get('attendees', [])),
+                "description": meeting.description[:200] + "...",
+                "attendees": meeting.attendee_count,
                 "userRole": item['role'],
                 "valueScore": item['score'],
                 "reasoning": item['reasoning'],
@@ -815,7 +1218,10 @@ Please use your imagination to create a comprehensive workback plan for this sce
             })
             prompt_id += 1
             
+        METRICS.add_time("prompt_build", time.perf_counter() - prompt_start)
+        
         # 5. Inject into HTML Template
+        render_start = time.perf_counter()
         template_path = Path("templates/devui_prompts_manager.html")
         if not template_path.exists():
             print("❌ Template file not found!")
@@ -845,70 +1251,154 @@ Please use your imagination to create a comprehensive workback plan for this sce
         
         # Save
         output_filename = f"mimic_{self.user_email.split('@')[0]}.html"
-        output_path = Path("output") / output_filename
-        output_path.parent.mkdir(exist_ok=True)
+        output_path = Path(output_dir) / output_filename
+        output_path.parent.mkdir(parents=True, exist_ok=True)
         
         with open(output_path, 'w', encoding='utf-8') as f:
             f.write(html_content)
+        METRICS.add_time("html_render", time.perf_counter() - render_start)
             
         print(f"\n✅ Mimic Interface generated: {output_path}")
-        print(f"   Open this file in your browser to start annotation.")
+        print("   Open this file in your browser to start annotation.")
         
         # Try to open
-        try:
-            webbrowser.open(f"file://{output_path.absolute()}")
-        except:
-            pass
+        if open_browser:
+            try:
+                webbrowser.open(f"file://{output_path.absolute()}")
+            except:
+                pass
+        
+        return output_path
+
+def load_local_meetings(path: str, days: int) -> List[Meeting]:
+    """Load meetings from a local JSON export, keeping the last N days like the Graph fetch does"""
+    from src.event_table import EventTable
+    
+    print(f"📂 Loading local file: {path}")
+    table = EventTable.load(path)
+    if table.unparseable:
+        print(f"⚠️ {table.unparseable} of {len(table)} events have no parseable start time "
+              f"({table.missing} missing, {table.malformed} malformed) and were skipped.")
+    
+    # Filter by date if using local file to mimic API behavior
+    print(f"📅 Filtering for last {days} days...")
+    filter_start = time.perf_counter()
+    end_date = datetime.utcnow()
+    start_date = end_date - timedelta(days=days)
+    in_range = table.in_range(start_date, end_date)
+    METRICS.add_time("date_filter", time.perf_counter() - filter_start)
+    
+    meetings = table.meetings(in_range)
+    weekly = table.weekly_stats(in_range)
+    series = table.series_sizes(in_range)
+    print(f"✅ Found {len(meetings)} meetings in range.")
+    if weekly["weeks"]:
+        print(f"   {weekly['meetings_per_week_mean']:.1f} meetings/week over {weekly['weeks']} weeks "
+              f"(busiest: week of {weekly['busiest_week']}, {weekly['busiest_week_meetings']} meetings)")
+    if series:
+        print(f"   {len(series)} recurring series with {sum(series.values())} occurrences")
+    return meetings
 
 def main():
     parser = argparse.ArgumentParser(description="Mimic: Meeting Value Estimator & Workback Plan Generator")
     parser.add_argument("email", help="User email address (used for identity and role detection)")
     parser.add_argument("--file", help="Optional: Use local JSON file instead of Graph API")
     parser.add_argument("--days", type=int, default=180, help="Number of days to look back (default: 180)")
+    parser.add_argument("--fetch-workers", type=int, default=4, help="Concurrent Graph requests when fetching (default: 4)")
+    parser.add_argument("--window-days", type=int, default=30, help="Days per concurrently fetched time window (default: 30)")
+    parser.add_argument("--incremental", action="store_true", help="Sync via Graph delta queries into a local event store; later runs only transfer changes")
+    parser.add_argument("--event-store", default="cache/events.sqlite", help="Local event store for --incremental (default: cache/events.sqlite)")
+    parser.add_argument("--batch-size", type=int, default=32, help="Number of meetings embedded per forward pass (default: 32)")
+    parser.add_argument("--no-pipeline", action="store_true", help="Load the model, fetch and score one after another instead of overlapping them")
+    add_classifier_args(parser)
+    add_prefilter_args(parser)
+    add_auth_args(parser)
+    parser.add_argument("--server", help="Score through a running mimic_server.py (e.g. http://127.0.0.1:8765) instead of loading the model")
+    parser.add_argument(
+        "--rerender",
+        nargs="?",
+        const="",
+        default=None,
+        metavar="SCORED_JSON",
+        help="Rebuild the HTML from a previous run's scored meetings without loading the model (default: output/mimic_<alias>_scored.json)"
+    )
+    add_profile_args(parser)
     
     args = parser.parse_args()
     
-    tool = MimicTool(args.email)
+    with profiling(args):
+        run(args)
+
+def run(args):
+    """One mimic.py run from parsed flags"""
+    if args.rerender is not None:
+        rerender(args)
+        return
+    
+    tool = MimicTool(
+        args.email,
+        server_url=args.server,
+        classifier_options=classifier_options(args),
+        prefilter_options=prefilter_options(args),
+        **auth_options(args)
+    )
+    
+    # Load the model while authenticating and fetching
+    if not args.no_pipeline:
+        if args.workers:
+            # Scoring workers are forked by the loader, which is only safe before the fetch threads start
+            with METRICS.timer("model_load"):
+                tool.load_classifier()
+        else:
+            tool.load_classifier_async()
     
     meetings = []
+    analyzed = None
     if args.file:
-        print(f"📂 Loading local file: {args.file}")
-        with open(args.file, 'r') as f:
-            data = json.load(f)
-            all_meetings = data.get('events', data) if isinstance(data, dict) else data
-            
-            # Filter by date if using local file to mimic API behavior
-            print(f"📅 Filtering for last {args.days} days...")
-            end_date = datetime.utcnow()
-            start_date = end_date - timedelta(days=args.days)
-            
-            meetings = []
-            for m in all_meetings:
-                # Handle various date formats
-                start_str = m.get('start', {}).get('dateTime') or m.get('start')
-                if start_str:
-                    try:
-                        # Simple ISO parsing (handles 'Z' and offsets roughly)
-                        evt_date = datetime.fromisoformat(start_str.replace('Z', '+00:00').split('.')[0])
-                        if start_date <= evt_date <= end_date:
-                            meetings.append(m)
-                    except:
-                        pass # Skip if date parse fails
-            print(f"✅ Found {len(meetings)} meetings in range.")
+        meetings = load_local_meetings(args.file, args.days)
             
     else:
-        if tool.authenticate():
-            meetings = tool.fetch_meetings(days=args.days)
-        else:
+        if not tool.authenticate():
             print("❌ Authentication failed. Exiting.")
             sys.exit(1)
+        if args.incremental:
+            with METRICS.timer("fetch"):
+                meetings = tool.sync_meetings(days=args.days, store_path=args.event_store)
+        elif args.no_pipeline:
+            with METRICS.timer("fetch"):
+                meetings = tool.fetch_meetings(days=args.days, workers=args.fetch_workers, window_days=args.window_days)
+        else:
+            # Score Graph pages as they arrive
+            with METRICS.timer("fetch_and_score"):
+                analyzed = tool.process_pages(
+                    tool.stream_meetings(days=args.days, workers=args.fetch_workers, window_days=args.window_days),
+                    batch_size=args.batch_size
+                )
             
-    if not meetings:
+    if not meetings and not tool.fetched_count:
         print("❌ No meetings found.")
         sys.exit(1)
         
-    analyzed = tool.process_meetings(meetings)
-    tool.generate_html_package(analyzed)
+    if analyzed is None:
+        analyzed = tool.process_meetings(meetings, batch_size=args.batch_size)
+    with METRICS.timer("report"):
+        tool.generate_html_package(analyzed)
+    path = scored_path(args.email)
+    save_scored(path, args.email, analyzed)
+    print(f"💾 Scored meetings saved to {path} (rebuild the report with --rerender)")
+
+def rerender(args):
+    """Rebuild the report from saved scored meetings; no Graph access and no model"""
+    path = Path(args.rerender) if args.rerender else scored_path(args.email)
+    if not path.exists():
+        print(f"❌ No scored meetings at {path}. Run mimic.py without --rerender first.")
+        sys.exit(1)
+    with METRICS.timer("json_load"):
+        user_email, analyzed = load_scored(path)
+    print(f"📂 Loaded {len(analyzed)} scored meetings for {user_email} from {path}")
+    tool = MimicTool(args.email)
+    with METRICS.timer("report"):
+        tool.generate_html_package(analyzed)
 
 if __name__ == "__main__":
     main()
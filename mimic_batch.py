@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Mimic Batch: generate reports for many users with one shared model
+Usage: python mimic_batch.py --roster emails.txt
+       python mimic_batch.py --calendar-dir exports/
+"""
+
+import sys
+import json
+import time
+import argparse
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from mimic import MimicTool, load_local_meetings
+from src.cli_options import add_classifier_args, classifier_options
+from src.prefilter import add_prefilter_args, prefilter_options
+from src.token_cache import add_auth_args, auth_options
+from src.server import ScoringClient
+
+def read_roster(path: str) -> List[str]:
+    """One email per line; blank lines and '#' comments are ignored"""
+    emails = []
+    with open(path, 'r') as f:
+        for line in f:
+            line = line.split('#', 1)[0].strip()
+            if line:
+                emails.append(line)
+    return emails
+
+def calendar_files(directory: str) -> Dict[str, Path]:
+    """Map user email (or alias) to calendar export, from files named <email>.json"""
+    return {path.stem: path for path in sorted(Path(directory).glob("*.json"))}
+
+def fetch_for_user(tool: MimicTool, args, local_file: Optional[Path]) -> List[Dict]:
+    """Fetch one user's meetings (runs in the fetch pool)"""
+    if local_file:
+        return load_local_meetings(str(local_file), args.days)
+    if args.incremental:
+        alias = tool.user_email.split('@')[0]
+        return tool.sync_meetings(days=args.days, store_path=str(Path(args.event_store_dir) / f"events_{alias}.sqlite"))
+    return tool.fetch_meetings(days=args.days, workers=args.fetch_workers, window_days=args.window_days)
+
+def main():
+    parser = argparse.ArgumentParser(description="Mimic Batch: reports for many users with one shared model")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--roster", help="File with one user email per line (calendars fetched from Graph)")
+    source.add_argument("--calendar-dir", help="Directory of local calendar exports named <email>.json")
+    parser.add_argument("--days", type=int, default=180, help="Number of days to look back (default: 180)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Users fetched concurrently while scoring (default: 4)")
+    parser.add_argument("--fetch-workers", type=int, default=2, help="Concurrent Graph requests per user (default: 2)")
+    parser.add_argument("--window-days", type=int, default=30, help="Days per concurrently fetched time window (default: 30)")
+    parser.add_argument("--incremental", action="store_true", help="Sync via Graph delta queries into per-user event stores")
+    parser.add_argument("--event-store-dir", default="cache", help="Directory for per-user event stores (default: cache)")
+    parser.add_argument("--model-path", "-m", help="Path to model directory", default="models/qwen3-embedding")
+    parser.add_argument("--batch-size", type=int, default=32, help="Number of meetings embedded per forward pass (default: 32)")
+    add_classifier_args(parser)
+    add_prefilter_args(parser)
+    add_auth_args(parser)
+    parser.add_argument("--server", help="Score through a running mimic_server.py instead of loading the model")
+    parser.add_argument("--summary", default="output/batch_summary.json", help="Where to write per-user timings (default: output/batch_summary.json)")
+
+    args = parser.parse_args()
+
+    if args.roster:
+        users = {email: None for email in read_roster(args.roster)}
+    else:
+        users = calendar_files(args.calendar_dir)
+    if not users:
+        print("❌ No users found.")
+        sys.exit(1)
+    print(f"👥 {len(users)} users queued")
+
+    # Authenticate once; every user's calendar is read with the operator's token
+    access_token = None
+    if args.roster:
+        if not args.account:
+            print("💡 Pass --account with the signed-in account's email so later runs can reuse its cached sign-in.")
+        operator = MimicTool(next(iter(users)), **auth_options(args))
+        if not operator.authenticate():
+            print("❌ Authentication failed. Exiting.")
+            sys.exit(1)
+        access_token = operator.access_token
+
+    # Load the model once and share it across all users
+    if args.server:
+        classifier = ScoringClient(args.server)
+    else:
+        from src.classifier import SimpleQwen3Classifier
+        classifier = SimpleQwen3Classifier(args.model_path, **classifier_options(args))
+
+    def make_tool(email: str) -> MimicTool:
+        tool = MimicTool(
+            email,
+            args.model_path,
+            server_url=args.server,
+            calendar_path=f"users/{email}" if args.roster else "me",
+            prefilter_options=prefilter_options(args)
+        )
+        tool.access_token = access_token
+        tool.classifier = classifier
+        return tool
+
+    tools = {email: make_tool(email) for email in users}
+    summary = []
+    start_total = time.time()
+    total_meetings = 0
+
+    def timed_fetch(email):
+        start = time.time()
+        meetings = fetch_for_user(tools[email], args, users[email])
+        return meetings, time.time() - start
+
+    # Fetch up to --concurrency users ahead while the main thread scores whoever finished first;
+    # the next user is submitted only once a finished fetch is taken, so fetched calendars never pile up
+    roster = iter(users)
+    pending = {}
+
+    def submit_next():
+        email = next(roster, None)
+        if email is not None:
+            pending[pool.submit(timed_fetch, email)] = email
+
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        for _ in range(args.concurrency):
+            submit_next()
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            future = next(iter(done))
+            email = pending.pop(future)
+            submit_next()
+            record = {"user": email, "status": "ok", "meetings": 0, "analyzed": 0}
+            try:
+                meetings, record["fetch_s"] = future.result()
+                record["meetings"] = len(meetings)
+                if not meetings:
+                    raise ValueError("No meetings found")
+
+                start = time.time()
+                analyzed = tools[email].process_meetings(meetings, batch_size=args.batch_size)
+                record["score_s"] = time.time() - start
+                record["analyzed"] = tools[email].analyzed_count
+                total_meetings += tools[email].analyzed_count
+
+                start = time.time()
+                output_path = tools[email].generate_html_package(analyzed, open_browser=False)
+                record["render_s"] = time.time() - start
+                if output_path is None:
+                    raise RuntimeError("Report template not found")
+                record["output"] = str(output_path)
+            except Exception as e:
+                # One user's failure must not stop the rest of the batch
+                record["status"] = "failed"
+                record["error"] = str(e)
+                print(f"\n❌ {email}: {e}")
+            summary.append(record)
+
+    elapsed = time.time() - start_total
+    ok = [r for r in summary if r["status"] == "ok"]
+
+    print(f"\n{'User':<40} {'Status':<8} {'Meetings':>8} {'Fetch s':>8} {'Score s':>8} {'Render s':>9}")
+    for r in summary:
+        print(
+            f"{r['user']:<40} {r['status']:<8} {r['analyzed']:>8} "
+            f"{r.get('fetch_s', 0):>8.1f} {r.get('score_s', 0):>8.1f} {r.get('render_s', 0):>9.2f}"
+        )
+    print(
+        f"\n✅ {len(ok)}/{len(summary)} users in {elapsed:.1f}s "
+        f"({total_meetings} meetings, {total_meetings / elapsed:.1f} meetings/s, {elapsed / len(summary):.1f}s per user)"
+    )
+
+    summary_path = Path(args.summary)
+    summary_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(summary_path, 'w') as f:
+        json.dump({
+            "generated": datetime.now().isoformat(),
+            "elapsed_s": elapsed,
+            "users_ok": len(ok),
+            "users_failed": len(summary) - len(ok),
+            "meetings_analyzed": total_meetings,
+            "meetings_per_s": total_meetings / elapsed if elapsed else 0.0,
+            "users": summary
+        }, f, indent=2)
+    print(f"💾 Summary saved to {summary_path}")
+
+    if len(ok) < len(summary):
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Mimic Scoring Server: keeps one Qwen3-Embedding model warm for all CLI runs
+Usage: python mimic_server.py [--port 8765]
+Then: python estimate_value.py <input_json> --server http://127.0.0.1:8765
+"""
+
+import sys
+import argparse
+from pathlib import Path
+from src.cli_options import add_classifier_args, classifier_options
+from src.server import DEFAULT_HOST, DEFAULT_PORT, make_server
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve Qwen3-Embedding meeting scoring over local HTTP")
+    parser.add_argument("--host", default=DEFAULT_HOST, help=f"Interface to bind (default: {DEFAULT_HOST})")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port to listen on (default: {DEFAULT_PORT})")
+    parser.add_argument("--model-path", "-m", help="Path to model directory", default="models/qwen3-embedding")
+    add_classifier_args(parser)
+
+    args = parser.parse_args()
+
+    model_path = Path(args.model_path)
+    if not model_path.exists():
+        model_path = Path(__file__).parent / args.model_path
+        if not model_path.exists():
+            print(f"❌ Model not found at: {model_path}")
+            print("Please ensure the model is downloaded to 'models/qwen3-embedding'")
+            sys.exit(1)
+
+    from src.classifier import SimpleQwen3Classifier
+    classifier = SimpleQwen3Classifier(str(model_path), **classifier_options(args))
+
+    server = make_server(classifier, args.host, args.port)
+    print(f"🛰️  Scoring server listening on http://{args.host}:{args.port}")
+    print("   Endpoints: GET /health, POST /score, POST /score_batch (Ctrl+C to stop)")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Shutting down.")
+    finally:
+        server.server_close()
+        if classifier.cache:
+            print(f"📦 {classifier.cache.summary()}")
+            classifier.cache.close()
+
+if __name__ == "__main__":
+    main()
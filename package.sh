@@ -13,8 +13,12 @@ mkdir -p dist/${PACKAGE_NAME}
 # Copy files
 cp mimic.py dist/${PACKAGE_NAME}/
 cp estimate_value.py dist/${PACKAGE_NAME}/
+cp mimic_server.py dist/${PACKAGE_NAME}/
+cp mimic_batch.py dist/${PACKAGE_NAME}/
 cp download_model.py dist/${PACKAGE_NAME}/
+cp export_onnx.py dist/${PACKAGE_NAME}/
 cp requirements.txt dist/${PACKAGE_NAME}/
+cp requirements-onnx.txt dist/${PACKAGE_NAME}/
 cp setup.sh dist/${PACKAGE_NAME}/
 cp run.sh dist/${PACKAGE_NAME}/
 cp setup.bat dist/${PACKAGE_NAME}/
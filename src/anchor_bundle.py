@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Precomputed category and value-anchor embeddings, saved next to the model
+A bundle is keyed by the classifier's model key plus a hash of the anchor text, so it is
+rebuilt only when the model, scoring options or category/anchor wording change
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+
+BUNDLE_VERSION = 1
+BUNDLE_DIR = "anchors"
+
+
+def bundle_key(model_key: str, categories: Dict[str, str], high_desc: str, low_desc: str, max_length: int) -> str:
+    """Hash of everything that determines the anchor vectors, including the length they were truncated to"""
+    payload = json.dumps(
+        {
+            "version": BUNDLE_VERSION,
+            "model_key": model_key,
+            "max_length": max_length,
+            "categories": list(categories.items()),
+            "high": high_desc,
+            "low": low_desc
+        },
+        sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def bundle_path(directory: str, key: str) -> Path:
+    return Path(directory) / f"anchors_{key[:16]}.npz"
+
+
+def load_bundle(path: Path, key: Optional[str] = None) -> Optional[Dict]:
+    """
+    Read a bundle; returns None if it is missing, unreadable or was built for a different key
+    Returns: dict with categories (name -> description), high, low, embeddings and meta
+    """
+    if not path.exists():
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data["meta"]))
+            if meta.get("version") != BUNDLE_VERSION or (key and meta.get("key") != key):
+                return None
+            return {
+                "categories": dict(zip(data["names"].tolist(), data["descriptions"].tolist())),
+                "high": meta["high"],
+                "low": meta["low"],
+                "embeddings": data["embeddings"].astype(np.float32),
+                "meta": meta
+            }
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def save_bundle(
+    path: Path,
+    key: str,
+    model_key: str,
+    categories: Dict[str, str],
+    high_desc: str,
+    low_desc: str,
+    embeddings: np.ndarray
+) -> bool:
+    """Write a bundle atomically; returns False if the directory is not writable"""
+    meta = {
+        "version": BUNDLE_VERSION,
+        "key": key,
+        "model_key": model_key,
+        "high": high_desc,
+        "low": low_desc
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez(
+                f,
+                meta=np.array(json.dumps(meta)),
+                names=np.array(list(categories), dtype=str),
+                descriptions=np.array(list(categories.values()), dtype=str),
+                embeddings=np.asarray(embeddings, dtype=np.float32)
+            )
+        os.replace(tmp_path, path)
+        return True
+    except OSError:
+        return False
+
+
+def load_categories(path: str) -> Dict[str, str]:
+    """
+    User-defined categories from a JSON object ({"name": "description", ...})
+    or from an existing anchor bundle (.npz)
+    """
+    if Path(path).suffix == ".npz":
+        bundle = load_bundle(Path(path))
+        if bundle is None:
+            raise ValueError(f"{path} is not a readable anchor bundle")
+        return bundle["categories"]
+
+    with open(path, "r", encoding="utf-8") as f:
+        categories = json.load(f)
+    if not isinstance(categories, dict) or not categories or not all(
+        isinstance(k, str) and isinstance(v, str) for k, v in categories.items()
+    ):
+        raise ValueError(f"{path} must contain a JSON object mapping category names to descriptions")
+    return categories
@@ -0,0 +1,321 @@
+#!/usr/bin/env python3
+"""
+Inference backends for SimpleQwen3Classifier
+Each backend maps padded token ids + attention mask to last_hidden_state as a NumPy array
+"""
+
+import inspect
+import json
+import mmap
+import shutil
+import struct
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Optional
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import torch
+
+from .cli_options import BACKENDS
+DEFAULT_ONNX_FILE = "onnx/model.onnx"
+ONNX_REQUIREMENTS = "requirements-onnx.txt"
+
+# safetensors header dtype -> torch dtype name
+SAFETENSORS_DTYPES = {
+    "F64": "float64", "F32": "float32", "F16": "float16", "BF16": "bfloat16",
+    "I64": "int64", "I32": "int32", "I16": "int16", "I8": "int8", "U8": "uint8", "BOOL": "bool"
+}
+
+
+def mmap_safetensors(model_path: str) -> Dict[str, "torch.Tensor"]:
+    """
+    Map every *.safetensors file in model_path and return tensors that are views into the mapping
+    Pages are read on first touch and stay in the shared page cache; a private (copy-on-write)
+    mapping keeps the files themselves read-only
+    """
+    import torch
+
+    files = sorted(Path(model_path).glob("*.safetensors"))
+    if not files:
+        raise FileNotFoundError(f"No .safetensors files in {model_path}")
+
+    tensors = {}
+    for path in files:
+        with open(path, "rb") as f:
+            header_size = struct.unpack("<Q", f.read(8))[0]
+            header = json.loads(f.read(header_size))
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        data_start = 8 + header_size
+
+        for name, info in header.items():
+            if name == "__metadata__":
+                continue
+            dtype = getattr(torch, SAFETENSORS_DTYPES[info["dtype"]])
+            begin, end = info["data_offsets"]
+            if end == begin:
+                tensors[name] = torch.empty(info["shape"], dtype=dtype)
+                continue
+            count = (end - begin) // torch.empty((), dtype=dtype).element_size()
+            # frombuffer holds a reference to the mapping for as long as the tensor lives
+            tensors[name] = torch.frombuffer(mapped, dtype=dtype, count=count, offset=data_start + begin).view(info["shape"])
+    return tensors
+
+
+def _import_onnx(*modules: str):
+    """Import the optional ONNX packages, naming the requirements file that provides them"""
+    import importlib
+
+    try:
+        return [importlib.import_module(module) for module in modules]
+    except ImportError as e:
+        raise ImportError(
+            f"The onnx backend needs {', '.join(modules)} ({e}). Install them with 'pip install -r {ONNX_REQUIREMENTS}'."
+        ) from e
+
+
+class TorchBackend:
+    """transformers.AutoModel on CPU (fp32, bf16 or dynamic int8)"""
+
+    name = "torch"
+
+    def __init__(
+        self,
+        model_path: str,
+        precision: str = "fp32",
+        intra_op_threads: Optional[int] = None,
+        inter_op_threads: Optional[int] = None,
+        mmap_weights: bool = False
+    ):
+        import torch
+        from transformers import AutoModel
+
+        self._torch = torch
+        if intra_op_threads:
+            torch.set_num_threads(intra_op_threads)
+        if inter_op_threads:
+            try:
+                torch.set_num_interop_threads(inter_op_threads)
+            except RuntimeError:
+                # Can only be set once, before any inter-op parallel work has started
+                pass
+
+        # int8 quantizes from float32 weights; bf16 halves memory on CPUs with native support
+        dtype = torch.bfloat16 if precision == "bf16" else torch.float32
+        if mmap_weights:
+            self.model = self._load_mmap(model_path, dtype)
+        else:
+            self.model = AutoModel.from_pretrained(
+                str(model_path),
+                torch_dtype=dtype,
+                device_map="cpu",
+                trust_remote_code=True
+            )
+
+        self.model.eval()
+
+        if precision == "int8":
+            # Dynamic quantization: int8 Linear weights, activations quantized on the fly
+            from torch.ao.quantization import quantize_dynamic
+            self.model = quantize_dynamic(self.model, {torch.nn.Linear}, dtype=torch.qint8)
+
+        self.hidden_size = self.model.config.hidden_size
+
+    def _load_mmap(self, model_path: str, dtype):
+        """
+        Build the model without initializing its weights, then point its parameters at the
+        memory-mapped checkpoint; tensors already in the requested dtype are used zero-copy,
+        the rest are converted into private memory (with a warning, since that copy is not shared)
+        """
+        from transformers import AutoConfig, AutoModel
+        try:
+            from transformers.initialization import no_init_weights
+        except ImportError:
+            # transformers < 5
+            from transformers.modeling_utils import no_init_weights
+
+        config = AutoConfig.from_pretrained(str(model_path), trust_remote_code=True)
+        with no_init_weights():
+            model = AutoModel.from_config(config, torch_dtype=dtype, trust_remote_code=True)
+
+        expected = set(model.state_dict())
+        prefix = model.base_model_prefix + "."
+        state = {}
+        converted: Dict[str, int] = {}
+        for name, tensor in mmap_safetensors(model_path).items():
+            # Checkpoints saved from a model with a head prefix the base model's keys
+            if name not in expected and name.startswith(prefix):
+                name = name[len(prefix):]
+            if name not in expected:
+                continue
+            if tensor.dtype != dtype and tensor.is_floating_point():
+                stored = str(tensor.dtype).replace("torch.", "")
+                converted[stored] = converted.get(stored, 0) + tensor.numel() * tensor.element_size()
+                tensor = tensor.to(dtype)
+            state[name] = tensor
+
+        missing = expected - set(state)
+        if missing:
+            raise ValueError(f"Checkpoint in {model_path} is missing {len(missing)} weights, e.g. {sorted(missing)[0]}")
+        if converted:
+            stored = ", ".join(sorted(converted))
+            print(
+                f"⚠️ --mmap-weights: {sum(converted.values()) / 2**20:.0f}MB of weights are stored as {stored} and were "
+                f"converted to {str(dtype).replace('torch.', '')} in private memory, so they are not shared through "
+                f"the page cache. Use the checkpoint's precision for a zero-copy load."
+            )
+        model.load_state_dict(state, assign=True)
+        return model
+
+    def forward(self, input_ids: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
+        """Run one padded batch; returns float32 array (batch, seq, hidden)"""
+        with self._torch.no_grad():
+            outputs = self.model(
+                input_ids=self._torch.from_numpy(input_ids),
+                attention_mask=self._torch.from_numpy(attention_mask)
+            )
+        return outputs.last_hidden_state.float().numpy()
+
+    def for_worker(self, threads: int) -> "TorchBackend":
+        """Backend to use inside a forked scoring worker: the same weights, fewer threads"""
+        self._torch.set_num_threads(threads)
+        return self
+
+
+class OnnxBackend:
+    """ONNX Runtime CPU session over a model exported with export_onnx()"""
+
+    name = "onnx"
+
+    def __init__(
+        self,
+        onnx_path: str,
+        intra_op_threads: Optional[int] = None,
+        inter_op_threads: Optional[int] = None
+    ):
+        ort, = _import_onnx("onnxruntime")
+
+        self.onnx_path = str(onnx_path)
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if intra_op_threads:
+            options.intra_op_num_threads = intra_op_threads
+        if inter_op_threads:
+            options.inter_op_num_threads = inter_op_threads
+            options.execution_mode = ort.ExecutionMode.ORT_PARALLEL
+
+        self.session = ort.InferenceSession(str(onnx_path), options, providers=["CPUExecutionProvider"])
+        self.hidden_size = self.session.get_outputs()[0].shape[-1]
+
+    def forward(self, input_ids: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
+        """Run one padded batch; returns float32 array (batch, seq, hidden)"""
+        return self.session.run(
+            ["last_hidden_state"],
+            {
+                "input_ids": input_ids.astype(np.int64),
+                "attention_mask": attention_mask.astype(np.int64)
+            }
+        )[0]
+
+    def for_worker(self, threads: int) -> "OnnxBackend":
+        """Backend to use inside a forked scoring worker"""
+        # ONNX Runtime's thread pool does not survive fork, so each worker opens its own session
+        return OnnxBackend(self.onnx_path, intra_op_threads=threads)
+
+
+def default_onnx_path(model_path: str) -> Path:
+    """Where export_onnx() writes by default: inside the model directory"""
+    return Path(model_path) / DEFAULT_ONNX_FILE
+
+
+def load_backend(
+    name: str,
+    model_path: str,
+    precision: str = "fp32",
+    onnx_path: Optional[str] = None,
+    intra_op_threads: Optional[int] = None,
+    inter_op_threads: Optional[int] = None,
+    mmap_weights: bool = False
+):
+    """Construct the named backend"""
+    if name == "torch":
+        return TorchBackend(model_path, precision, intra_op_threads, inter_op_threads, mmap_weights)
+    if name == "onnx":
+        if mmap_weights:
+            raise ValueError("mmap_weights applies to the torch backend's safetensors checkpoint")
+        if precision != "fp32":
+            raise ValueError("The onnx backend runs the exported fp32 graph; use precision='fp32'")
+        path = Path(onnx_path) if onnx_path else default_onnx_path(model_path)
+        if not path.exists():
+            raise FileNotFoundError(f"ONNX model not found at {path}. Run 'python export_onnx.py' first.")
+        return OnnxBackend(str(path), intra_op_threads, inter_op_threads)
+    raise ValueError(f"Unknown backend '{name}', expected one of {BACKENDS}")
+
+
+def export_onnx(
+    model_path: str,
+    output_path: Optional[str] = None,
+    opset: int = 17,
+    optimize: bool = True
+) -> Path:
+    """
+    Export the embedding model to ONNX with dynamic batch/sequence axes
+    With optimize=True, ONNX Runtime's offline graph optimizations are applied before saving
+    """
+    import torch
+    from transformers import AutoModel, AutoTokenizer
+
+    # torch.onnx's exporter needs the onnx package; the optimization pass needs onnxruntime
+    _import_onnx(*(("onnx", "onnxruntime") if optimize else ("onnx",)))
+
+    output = Path(output_path) if output_path else default_onnx_path(model_path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    # fp32 weights exceed protobuf's 2GB limit, so the exporter spills them into external
+    # data files next to the graph; keep the unoptimized export in its own directory
+    export_path = output.parent / "raw" / output.name if optimize else output
+    export_path.parent.mkdir(parents=True, exist_ok=True)
+
+    model = AutoModel.from_pretrained(str(model_path), torch_dtype=torch.float32, trust_remote_code=True)
+    model.eval()
+    tokenizer = AutoTokenizer.from_pretrained(str(model_path), trust_remote_code=True)
+
+    class _LastHiddenState(torch.nn.Module):
+        def __init__(self, model):
+            super().__init__()
+            self.model = model
+
+        def forward(self, input_ids, attention_mask):
+            return self.model(input_ids=input_ids, attention_mask=attention_mask).last_hidden_state
+
+    sample = tokenizer(["Meeting: Weekly sync", "Meeting: Quarterly business review. 12 attendees"], padding=True, return_tensors="pt")
+    axes = {0: "batch", 1: "sequence"}
+    kwargs = {}
+    if "dynamo" in inspect.signature(torch.onnx.export).parameters:
+        # The TorchScript exporter handles dynamic_axes for every torch>=2.0
+        kwargs["dynamo"] = False
+
+    with torch.no_grad():
+        torch.onnx.export(
+            _LastHiddenState(model),
+            (sample["input_ids"], sample["attention_mask"]),
+            str(export_path),
+            input_names=["input_ids", "attention_mask"],
+            output_names=["last_hidden_state"],
+            dynamic_axes={"input_ids": axes, "attention_mask": axes, "last_hidden_state": axes},
+            opset_version=opset,
+            **kwargs
+        )
+
+    if optimize:
+        ort, = _import_onnx("onnxruntime")
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+        options.optimized_model_filepath = str(output)
+        options.add_session_config_entry(
+            "session.optimized_model_external_initializers_file_name", output.name + ".data"
+        )
+        ort.InferenceSession(str(export_path), options, providers=["CPUExecutionProvider"])
+        shutil.rmtree(export_path.parent)
+
+    return output
@@ -1,16 +1,24 @@
 #!/usr/bin/env python3
 """
-Simple Qwen3-Embedding classifier using only transformers and torch
+Simple Qwen3-Embedding classifier using only transformers and torch (or ONNX Runtime)
 No sklearn, no sentence-transformers dependencies
 """
 
-import torch
-from transformers import AutoTokenizer, AutoModel
-from typing import Dict, List, Optional, Tuple
+from transformers import AutoTokenizer
+from typing import Any, Dict, List, Optional, Tuple
 from pathlib import Path
 import json
+import time
 import numpy as np
 
+from .anchor_bundle import BUNDLE_DIR, bundle_key, bundle_path, load_bundle, save_bundle
+from .backends import BACKENDS, load_backend
+from .context_builder import ContextBuilder
+from .cli_options import POOLING_MODES, PRECISIONS
+from .embedding_cache import EmbeddingCache, model_revision
+from .metrics import METRICS
+from .worker_pool import ScoringPool
+
 
 class SimpleQwen3Classifier:
     """Meeting classifier using Qwen3-Embedding with minimal dependencies"""
@@ -35,10 +43,74 @@ class SimpleQwen3Classifier:
     CALIBRATION_SLOPE = 2.0089
     CALIBRATION_INTERCEPT = -79.3864
     
-    def __init__(self, model_path: str):
+    POOLING_MODES = POOLING_MODES
+    PRECISIONS = PRECISIONS
+    MAX_LENGTH = 512
+    
+    # Callers hand over this many batches at a time so length bucketing has room to sort
+    BUCKET_WINDOW = 8
+    
+    def __init__(
+        self,
+        model_path: str,
+        cache_path: Optional[str] = None,
+        cache_memory_entries: int = 4096,
+        cache_max_mb: float = 256,
+        pooling: str = "mean",
+        precision: str = "fp32",
+        backend: str = "torch",
+        onnx_path: Optional[str] = None,
+        intra_op_threads: Optional[int] = None,
+        inter_op_threads: Optional[int] = None,
+        workers: int = 0,
+        mmap_weights: bool = False,
+        categories: Optional[Dict[str, str]] = None,
+        anchor_dir: Optional[str] = None,
+        context_tokens: Optional[int] = None,
+        clean_context: bool = False
+    ):
+        # Seconds since construction started, for reporting cold-start cost
+        self._started = time.perf_counter()
+        self.timings = {"load_s": None, "ready_s": None, "first_score_s": None}
         self.model_path = Path(model_path)
+        # Precomputed anchor bundles live next to the model unless redirected
+        self.anchor_dir = Path(anchor_dir) if anchor_dir else self.model_path / BUNDLE_DIR
+        
+        if precision not in self.PRECISIONS:
+            raise ValueError(f"Unknown precision '{precision}', expected one of {self.PRECISIONS}")
+        self.precision = precision
+        
+        # "mean" matches the calibration; "last" is the last-token pooling Qwen3-Embedding was trained with
+        if pooling not in self.POOLING_MODES:
+            raise ValueError(f"Unknown pooling '{pooling}', expected one of {self.POOLING_MODES}")
+        self.pooling = pooling
         
-        print(f"Loading Qwen3-Embedding from {self.model_path}...")
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend '{backend}', expected one of {BACKENDS}")
+        
+        # Tokens actually processed vs. padded positions, for checking the length-bucketed scheduler
+        self.token_stats = {"tokens": 0, "padded_tokens": 0, "batches": 0}
+        self.workers = None
+        
+        # Off by default: the calibration was fitted on the raw context
+        if context_tokens is not None and not 0 < context_tokens <= self.MAX_LENGTH:
+            raise ValueError(f"context_tokens must be between 1 and {self.MAX_LENGTH}")
+        self.max_length = context_tokens or self.MAX_LENGTH
+        
+        # Everything that changes the vectors for a given text goes into the cache key
+        self.model_key = (
+            f"{model_revision(str(self.model_path))}:{self.pooling}:{self.precision}:{backend}:{self.max_length}"
+        )
+        self.cache = None
+        if cache_path:
+            self.cache = EmbeddingCache(
+                cache_path,
+                self.model_key,
+                memory_entries=cache_memory_entries,
+                max_disk_mb=cache_max_mb
+            )
+        
+        print(f"Loading Qwen3-Embedding from {self.model_path} ({backend}, {self.precision})...")
         
         # Load tokenizer and model
         self.tokenizer = AutoTokenizer.from_pretrained(
@@ -46,52 +118,282 @@ class SimpleQwen3Classifier:
             trust_remote_code=True
         )
         
-        self.model = AutoModel.from_pretrained(
+        self.context_builder = ContextBuilder(self.tokenizer, max_tokens=context_tokens, clean=clean_context)
+        
+        # With workers, --threads is the per-worker limit and is applied inside each worker
+        self.backend = load_backend(
+            backend,
             str(self.model_path),
-            torch_dtype=torch.float32,  # Use float32 for CPU
-            device_map="cpu",
-            trust_remote_code=True
+            precision=precision,
+            onnx_path=onnx_path,
+            intra_op_threads=None if workers > 1 else intra_op_threads,
+            inter_op_threads=inter_op_threads,
+            mmap_weights=mmap_weights
         )
+        self.timings["load_s"] = time.perf_counter() - self._started
         
-        self.model.eval()
-        
-        print("✅ Model loaded")
+        print(f"✅ Model loaded in {self.timings['load_s']:.1f}s{' (memory-mapped)' if mmap_weights else ''}")
         print("📊 Pre-computing category and value embeddings...")
         
-        # Pre-compute category embeddings
-        self.category_embeddings = {}
-        for cat_name, cat_desc in self.TEMPLATE_CATEGORIES.items():
-            text = f"{cat_name}: {cat_desc}"
-            emb = self._embed(text)
-            self.category_embeddings[cat_name] = emb
-            
-        # Pre-compute value anchors
-        self.high_value_emb = self._embed(self.HIGH_VALUE_DESC)
-        self.low_value_emb = self._embed(self.LOW_VALUE_DESC)
+        # Category embeddings and value anchors: from the saved bundle, or computed in one batch
+        self._set_anchors(categories or self.TEMPLATE_CATEGORIES)
         
         print(f"✅ {len(self.category_embeddings)} categories ready")
-        print(f"✅ Value estimation anchors ready\n")
+        print(f"✅ Value estimation anchors ready")
+        self.timings["ready_s"] = time.perf_counter() - self._started
+        
+        # Fork only once the model is fully loaded so workers share its weights
+        if workers > 1:
+            self.workers = ScoringPool(self, workers, threads_per_worker=intra_op_threads)
+            print(f"✅ {workers} scoring workers started ({self.workers.threads_per_worker} threads each)")
+        print()
     
+    def _set_anchors(self, categories: Dict[str, str]):
+        """
+        Embed category descriptions plus the high/low value anchors and stack them
+        into one row-normalized matrix: rows [0, n) are categories, then high, then low
+        The vectors are reused from an anchor bundle when one matches the model and text
+        Anchors are always embedded at MAX_LENGTH; --context-tokens only truncates meetings
+        """
+        key = bundle_key(self.model_key, categories, self.HIGH_VALUE_DESC, self.LOW_VALUE_DESC, self.MAX_LENGTH)
+        path = bundle_path(str(self.anchor_dir), key)
+        bundle = load_bundle(path, key)
+        if bundle is not None:
+            embeddings = bundle["embeddings"]
+            print(f"📦 Anchors loaded from {path}")
+        else:
+            texts = [f"{cat_name}: {cat_desc}" for cat_name, cat_desc in categories.items()]
+            texts += [self.HIGH_VALUE_DESC, self.LOW_VALUE_DESC]
+            embeddings = self.embed_batch(texts, max_length=self.MAX_LENGTH)
+            if save_bundle(path, key, self.model_key, categories, self.HIGH_VALUE_DESC, self.LOW_VALUE_DESC, embeddings):
+                print(f"📦 Anchors saved to {path}")
+        
+        self.categories = dict(categories)
+        self.category_names = list(categories)
+        self.category_embeddings = dict(zip(self.category_names, embeddings[:len(categories)]))
+        self.high_value_emb = embeddings[-2]
+        self.low_value_emb = embeddings[-1]
+        
+        self.anchor_matrix = self._normalize_rows(embeddings)
+        self._high_row = len(categories)
+        self._low_row = len(categories) + 1
+
+    @staticmethod
+    def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+        """L2-normalize each row so a dot product is a cosine similarity"""
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.maximum(norms, 1e-12)
+
+    def _build_context(
+        self,
+        title: str,
+        description: Optional[str] = None,
+        attendee_count: Optional[int] = None
+    ) -> str:
+        """Build the text that is embedded for a meeting"""
+        return self.context_builder.build_batch([title], [description], [attendee_count])[0]
+
     def _embed(self, text: str) -> np.ndarray:
         """Generate embedding for text"""
-        inputs = self.tokenizer(
-            text,
-            return_tensors="pt",
-            truncation=True,
-            padding=True,
-            max_length=512
-        )
+        return self.embed_batch([text])[0]
+
+    def embed_batch(self, texts: List[str], batch_size: int = 32, max_length: Optional[int] = None) -> np.ndarray:
+        """
+        Generate embeddings for many texts, batch_size at a time
+        Identical texts are embedded once; cached texts are not embedded at all
+        max_length overrides self.max_length; the cache is keyed by self.max_length, so it is bypassed then
+        Returns: array of shape (len(texts), hidden_size)
+        """
+        max_length = max_length or self.max_length
+        cache = self.cache if max_length == self.max_length else None
+        embeddings = np.zeros((len(texts), self.backend.hidden_size), dtype=np.float32)
+        
+        with METRICS.timer("cache"):
+            cached = cache.get_many(texts) if cache else {}
+        for i, emb in cached.items():
+            embeddings[i] = emb
+        
+        # Group remaining positions by text so repeats share one forward pass
+        pending = {}
+        for i, text in enumerate(texts):
+            if i not in cached:
+                pending.setdefault(text, []).append(i)
+        
+        METRICS.count("texts_cached", len(cached))
+        METRICS.count("texts_embedded", len(pending))
+        if pending:
+            unique_texts = list(pending)
+            fresh = self._embed_uncached(unique_texts, batch_size, max_length)
+            for text, emb in zip(unique_texts, fresh):
+                embeddings[pending[text]] = emb
+            if cache:
+                with METRICS.timer("cache"):
+                    cache.put_many(unique_texts, fresh)
+        
+        return embeddings
+
+    def _embed_uncached(self, texts: List[str], batch_size: int, max_length: Optional[int] = None) -> np.ndarray:
+        """
+        Run texts through the model in length-bucketed batches
+        Texts are sorted by token count so each batch pads to a similar length
+        """
+        with METRICS.timer("tokenize"):
+            encoded = self.tokenizer(texts, truncation=True, max_length=max_length or self.max_length)
+        lengths = [len(ids) for ids in encoded["input_ids"]]
+        order = sorted(range(len(texts)), key=lambda i: lengths[i])
+        
+        buckets = [order[start:start + batch_size] for start in range(0, len(order), batch_size)]
+        inputs = [
+            (
+                [encoded["input_ids"][i] for i in bucket],
+                [encoded["attention_mask"][i] for i in bucket]
+            )
+            for bucket in buckets
+        ]
+        
+        # Small requests are not worth the inter-process round trip
+        if self.workers and len(buckets) > 1:
+            # Padding, forward and pooling all happen in the workers
+            with METRICS.timer("inference"):
+                pooled = self.workers.map_buckets(inputs)
+        else:
+            pooled = [self._forward_bucket(input_ids, attention_mask) for input_ids, attention_mask in inputs]
         
-        with torch.no_grad():
-            outputs = self.model(**inputs)
-            # Mean pooling
-            embedding = outputs.last_hidden_state.mean(dim=1)
+        embeddings = np.zeros((len(texts), self.backend.hidden_size), dtype=np.float32)
+        for bucket, bucket_embeddings in zip(buckets, pooled):
+            self.token_stats["tokens"] += sum(lengths[i] for i in bucket)
+            self.token_stats["padded_tokens"] += len(bucket) * max(lengths[i] for i in bucket)
+            self.token_stats["batches"] += 1
+            embeddings[bucket] = bucket_embeddings
+
+        return embeddings
+
+    def _forward_bucket(self, input_ids: List[List[int]], attention_mask: List[List[int]]) -> np.ndarray:
+        """Pad one bucket of tokenized texts, run the model and pool (also runs inside scoring workers)"""
+        with METRICS.timer("tokenize"):
+            inputs = self.tokenizer.pad(
+                {"input_ids": input_ids, "attention_mask": attention_mask},
+                return_tensors="np"
+            )
+        with METRICS.timer("inference"):
+            hidden = self.backend.forward(inputs["input_ids"], inputs["attention_mask"])
+        with METRICS.timer("pooling"):
+            return self._pool(hidden, inputs["attention_mask"])
+
+    def _pool(self, hidden: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
+        """Pool token states (batch, seq, hidden) into one vector per text, ignoring padding"""
+        if self.pooling == "last":
+            # Left padding: every row ends on a real token
+            if attention_mask[:, -1].all():
+                return hidden[:, -1]
+            last_index = attention_mask.sum(axis=1) - 1
+            return hidden[np.arange(hidden.shape[0]), last_index]
         
-        return embedding.cpu().numpy().flatten()
+        # Mean pooling over real tokens only, so padding does not skew short texts
+        mask = attention_mask[:, :, None].astype(hidden.dtype)
+        return (hidden * mask).sum(axis=1) / np.maximum(mask.sum(axis=1), 1)
+
+    def timing_summary(self) -> str:
+        """One-line cold-start report: model load, anchors ready, first meeting scored"""
+        parts = [f"model loaded in {self.timings['load_s']:.1f}s", f"ready in {self.timings['ready_s']:.1f}s"]
+        if self.timings["first_score_s"] is not None:
+            parts.append(f"first score after {self.timings['first_score_s']:.1f}s")
+        return "Startup: " + ", ".join(parts)
+
+    def padding_efficiency(self) -> float:
+        """Fraction of processed positions that were real tokens (1.0 = no padding waste)"""
+        if not self.token_stats["padded_tokens"]:
+            return 1.0
+        return self.token_stats["tokens"] / self.token_stats["padded_tokens"]
     
-    def _cosine_similarity(self, vec1: np.ndarray, vec2: np.ndarray) -> float:
-        """Calculate cosine similarity"""
-        return np.dot(vec1, vec2) / (np.linalg.norm(vec1) * np.linalg.norm(vec2))
+    def _embed_meetings(
+        self,
+        titles: List[str],
+        descriptions: Optional[List[Optional[str]]] = None,
+        attendee_counts: Optional[List[Optional[int]]] = None,
+        batch_size: int = 32
+    ) -> np.ndarray:
+        """Build contexts for parallel lists of meeting fields and embed them in batches"""
+        descriptions = descriptions or [None] * len(titles)
+        attendee_counts = attendee_counts or [None] * len(titles)
+        with METRICS.timer("context"):
+            contexts = self.context_builder.build_batch(titles, descriptions, attendee_counts)
+        return self.embed_batch(contexts, batch_size=batch_size)
+
+    def score_embeddings(
+        self,
+        embeddings: np.ndarray,
+        attendee_counts: Optional[List[Optional[int]]] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Score a batch of meeting embeddings with one matrix product against all anchors
+        Returns: dict of per-meeting arrays (scores, final_scores, high_sim, low_sim,
+                 category_index, confidence) plus the full similarity matrix
+        """
+        n = len(embeddings)
+        counts = np.array(
+            [c or 0 for c in (attendee_counts or [None] * n)],
+            dtype=np.float64
+        )
+        
+        similarities = self._normalize_rows(np.asarray(embeddings, dtype=np.float32)) @ self.anchor_matrix.T
+        
+        # Category: best cosine similarity, normalized from [-1, 1] to [0, 1]
+        category_sims = similarities[:, :self._high_row]
+        category_index = np.argmax(category_sims, axis=1)
+        confidence = (category_sims[np.arange(n), category_index] + 1) / 2
+        
+        # Value: simple projection (high - low + 1) / 2 maps [-1, 1] difference to [0, 1]
+        high_sim = similarities[:, self._high_row].astype(np.float64)
+        low_sim = similarities[:, self._low_row].astype(np.float64)
+        raw_score = (high_sim - low_sim + 1) / 2
+        
+        # Attendee boost (logarithmic): 10 attendees -> +0.1, 100 attendees -> +0.2
+        attendee_boost = np.minimum(0.2, np.log10(np.maximum(1, counts)) / 10)
+        final_score = np.minimum(100, (raw_score + attendee_boost) * 100)
+        
+        # Apply calibration to match Qwen3-30B variance
+        # Formula: y = 2.0089 * x - 79.3864
+        calibrated = np.clip(self.CALIBRATION_SLOPE * final_score + self.CALIBRATION_INTERCEPT, 0, 100)
+        
+        return {
+            "scores": calibrated,
+            "final_scores": final_score,
+            "high_sim": high_sim,
+            "low_sim": low_sim,
+            "category_index": category_index,
+            "confidence": confidence,
+            "similarities": similarities
+        }
+
+    def _reasoning(self, high_sim: float, low_sim: float, final_score: float, attendee_count: Optional[int]) -> str:
+        """Generate "reasoning" (synthetic based on score components)"""
+        reasoning = f"Semantic similarity to high-value concepts: {high_sim:.2f} vs low-value: {low_sim:.2f}."
+        if attendee_count and attendee_count > 20:
+            reasoning += f" Boosted by high attendee count ({attendee_count})."
+        reasoning += f" Calibrated from raw score {final_score:.1f}."
+        return reasoning
+
+    def _analyses_from_embeddings(
+        self,
+        embeddings: np.ndarray,
+        attendee_counts: Optional[List[Optional[int]]] = None
+    ) -> List[Dict[str, Any]]:
+        """Turn a scored batch into per-meeting result dicts"""
+        counts = attendee_counts or [None] * len(embeddings)
+        with METRICS.timer("scoring"):
+            scored = self.score_embeddings(embeddings, counts)
+            return [
+                {
+                    "score": float(scored["scores"][i]),
+                    "reasoning": self._reasoning(
+                        scored["high_sim"][i], scored["low_sim"][i], scored["final_scores"][i], counts[i]
+                    ),
+                    "category": self.category_names[scored["category_index"][i]],
+                    "confidence": float(scored["confidence"][i])
+                }
+                for i in range(len(embeddings))
+            ]
     
     def classify_meeting(
         self,
@@ -100,30 +402,21 @@ class SimpleQwen3Classifier:
         attendee_count: Optional[int] = None
     ) -> Tuple[str, float]:
         """Classify meeting into category"""
-        # Build context
-        context = f"Meeting: {title}"
-        if description:
-            context += f". {description}"
-        if attendee_count:
-            context += f". {attendee_count} attendees"
-        
-        # Get meeting embedding
-        meeting_emb = self._embed(context)
-        
-        # Calculate similarities
-        best_category = None
-        best_score = -1.0
-        
-        for cat_name, cat_emb in self.category_embeddings.items():
-            similarity = self._cosine_similarity(meeting_emb, cat_emb)
-            if similarity > best_score:
-                best_score = similarity
-                best_category = cat_name
-        
-        # Normalize confidence from [-1, 1] to [0, 1]
-        confidence = (best_score + 1) / 2
-        
-        return best_category, confidence
+        analysis = self.analyze(title, description, attendee_count)
+        return analysis["category"], analysis["confidence"]
+
+    def classify_meeting_batch(
+        self,
+        titles: List[str],
+        descriptions: Optional[List[Optional[str]]] = None,
+        attendee_counts: Optional[List[Optional[int]]] = None,
+        batch_size: int = 32
+    ) -> List[Tuple[str, float]]:
+        """Classify many meetings, embedding them in padded batches"""
+        return [
+            (analysis["category"], analysis["confidence"])
+            for analysis in self.analyze_batch(titles, descriptions, attendee_counts, batch_size)
+        ]
 
     def estimate_value(
         self,
@@ -135,45 +428,58 @@ class SimpleQwen3Classifier:
         Estimate meeting value using semantic similarity to value anchors
         Returns: (score 0-100, reasoning string)
         """
-        # Build context
-        context = f"Meeting: {title}"
-        if description:
-            context += f". {description}"
-        if attendee_count:
-            context += f". {attendee_count} attendees"
-            
-        # Get meeting embedding
-        meeting_emb = self._embed(context)
-        
-        # Calculate similarity to high and low value anchors
-        high_sim = self._cosine_similarity(meeting_emb, self.high_value_emb)
-        low_sim = self._cosine_similarity(meeting_emb, self.low_value_emb)
-        
-        # Calculate raw score based on relative similarity
-        # If closer to high than low, score > 50
-        # We use softmax-like logic or simple projection
-        
-        # Simple projection: (high - low + 1) / 2  -> maps [-1, 1] difference to [0, 1]
-        diff = high_sim - low_sim
-        raw_score = (diff + 1) / 2  # 0.0 to 1.0
-        
-        # Apply attendee boost (logarithmic)
-        attendee_boost = 0
-        if attendee_count:
-            # 10 attendees -> +0.1, 100 attendees -> +0.2
-            attendee_boost = min(0.2, np.log10(max(1, attendee_count)) / 10)
-            
-        final_score = min(100, (raw_score + attendee_boost) * 100)
-        
-        # Apply calibration to match Qwen3-30B variance
-        # Formula: y = 2.0089 * x - 79.3864
-        calibrated_score = self.CALIBRATION_SLOPE * final_score + self.CALIBRATION_INTERCEPT
-        calibrated_score = max(0, min(100, calibrated_score))
-        
-        # Generate "reasoning" (synthetic based on score components)
-        reasoning = f"Semantic similarity to high-value concepts: {high_sim:.2f} vs low-value: {low_sim:.2f}."
-        if attendee_count and attendee_count > 20:
-            reasoning += f" Boosted by high attendee count ({attendee_count})."
-        reasoning += f" Calibrated from raw score {final_score:.1f}."
-            
-        return calibrated_score, reasoning
+        analysis = self.analyze(title, description, attendee_count)
+        return analysis["score"], analysis["reasoning"]
+
+    def estimate_value_batch(
+        self,
+        titles: List[str],
+        descriptions: Optional[List[Optional[str]]] = None,
+        attendee_counts: Optional[List[Optional[int]]] = None,
+        batch_size: int = 32
+    ) -> List[Tuple[float, str]]:
+        """
+        Estimate value for many meetings, embedding them in padded batches
+        Returns: list of (score 0-100, reasoning string), in input order
+        """
+        return [
+            (analysis["score"], analysis["reasoning"])
+            for analysis in self.analyze_batch(titles, descriptions, attendee_counts, batch_size)
+        ]
+
+    def analyze(
+        self,
+        title: str,
+        description: Optional[str] = None,
+        attendee_count: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Estimate value and classify a meeting from a single embedding
+        Returns: dict with score, reasoning, category and confidence
+        """
+        return self.analyze_batch([title], [description], [attendee_count])[0]
+
+    def analyze_batch(
+        self,
+        titles: List[str],
+        descriptions: Optional[List[Optional[str]]] = None,
+        attendee_counts: Optional[List[Optional[int]]] = None,
+        batch_size: int = 32
+    ) -> List[Dict[str, Any]]:
+        """
+        Batched analyze(): one forward pass per meeting shared by value scoring and classification
+        Returns: list of dicts with score, reasoning, category and confidence, in input order
+        """
+        embeddings = self._embed_meetings(titles, descriptions, attendee_counts, batch_size)
+        analyses = self._analyses_from_embeddings(embeddings, attendee_counts)
+        if self.timings["first_score_s"] is None:
+            self.timings["first_score_s"] = time.perf_counter() - self._started
+        return analyses
+
+    def close(self):
+        """Stop scoring workers and close the embedding cache"""
+        if self.workers:
+            self.workers.close()
+            self.workers = None
+        if self.cache:
+            self.cache.close()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Command-line options shared by every entry point that constructs SimpleQwen3Classifier
+"""
+
+import argparse
+from typing import Any, Dict
+
+# Kept free of numpy/torch imports so building a parser stays cheap
+POOLING_MODES = ("mean", "last")
+PRECISIONS = ("fp32", "bf16", "int8")
+BACKENDS = ("torch", "onnx")
+DEFAULT_CACHE = "cache/embeddings.sqlite"
+
+
+def add_classifier_args(parser: argparse.ArgumentParser):
+    """Add cache, pooling, precision, backend, weight loading, category, context, threading and worker flags"""
+    group = parser.add_argument_group("model options")
+    group.add_argument("--cache", default=DEFAULT_CACHE, help=f"Embedding cache file (default: {DEFAULT_CACHE})")
+    group.add_argument("--no-cache", action="store_true", help="Disable the on-disk embedding cache")
+    group.add_argument("--pooling", choices=POOLING_MODES, default="mean", help="Embedding pooling (default: mean, which the calibration was fitted on)")
+    group.add_argument("--precision", choices=PRECISIONS, default="fp32", help="Inference precision: fp32 (default), bf16, or int8 dynamic quantization")
+    group.add_argument("--backend", choices=BACKENDS, default="torch", help="Inference backend (default: torch; onnx needs 'python export_onnx.py' first)")
+    group.add_argument("--onnx-path", default=None, help="ONNX model for --backend onnx (default: <model-path>/onnx/model.onnx)")
+    group.add_argument("--threads", type=int, default=None, help="Intra-op threads for inference, per worker with --workers (default: library default, or cores / workers)")
+    group.add_argument("--interop-threads", type=int, default=None, help="Inter-op threads for inference (default: library default)")
+    group.add_argument("--mmap-weights", action="store_true", help="Memory-map the safetensors checkpoint instead of copying it into memory (torch backend)")
+    group.add_argument("--clean-context", action="store_true", help="Strip HTML, Teams/Zoom join footers, links and extra whitespace from descriptions before embedding")
+    group.add_argument("--context-tokens", type=int, default=None, help="Token budget per meeting; longer descriptions are cut (default: no budget beyond the model's 512)")
+    group.add_argument("--categories", default=None, help="Custom categories: JSON object of name -> description, or an anchor bundle (.npz)")
+    group.add_argument("--anchor-dir", default=None, help="Where anchor bundles are stored (default: <model-path>/anchors)")
+    group.add_argument("--workers", type=int, default=0, help="Scoring processes sharing the loaded model via fork (default: 0, score in-process)")
+
+
+def classifier_options(args: argparse.Namespace) -> Dict[str, Any]:
+    """Keyword arguments for SimpleQwen3Classifier from parsed flags"""
+    from .anchor_bundle import load_categories
+
+    return {
+        "cache_path": None if args.no_cache else args.cache,
+        "pooling": args.pooling,
+        "precision": args.precision,
+        "backend": args.backend,
+        "onnx_path": args.onnx_path,
+        "intra_op_threads": args.threads,
+        "inter_op_threads": args.interop_threads,
+        "workers": args.workers,
+        "mmap_weights": args.mmap_weights,
+        "categories": load_categories(args.categories) if args.categories else None,
+        "anchor_dir": args.anchor_dir,
+        "context_tokens": args.context_tokens,
+        "clean_context": args.clean_context
+    }
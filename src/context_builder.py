@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Meeting text for the embedding model: HTML and Teams/Zoom join boilerplate removed,
+whitespace collapsed and the description cut to a token budget
+"""
+
+import html
+import re
+from typing import List, Optional
+
+_TAG = re.compile(r"<[^>]+>")
+_BLOCK_TAG = re.compile(r"<\s*(br|/p|/div|/li|/tr|/h\d)\b[^>]*>", re.IGNORECASE)
+_HIDDEN_BLOCK = re.compile(r"<\s*(style|script|head)\b.*?<\s*/\s*\1\s*>", re.IGNORECASE | re.DOTALL)
+_WHITESPACE = re.compile(r"\s+")
+_URL = re.compile(r"https?://\S+|<https?://[^>]*>")
+# First line of the join block Outlook/Teams/Zoom append to invites; everything after it is boilerplate
+_FOOTER = re.compile(
+    r"("
+    r"Microsoft Teams (meeting|Need help\?)|Join (the meeting now|on your computer|Microsoft Teams Meeting|Zoom Meeting)|"
+    r"Click here to join the meeting|Meeting ID\s*:|Passcode\s*:|Join by phone|Dial-in by phone|"
+    r"\w+ is inviting you to a scheduled Zoom meeting)",
+    re.IGNORECASE
+)
+# Rule line Teams/Outlook draw above the join block; on its own it is just a divider (agenda, signature)
+_RULE = re.compile(r"_{8,}|-{8,}")
+# A rule belongs to the footer only if a join marker follows within this many lines and characters
+_RULE_MAX_LINES = 3
+_RULE_MAX_CHARS = 200
+
+
+def strip_html(text: str) -> str:
+    """Tags removed (block tags become line breaks) and entities unescaped"""
+    text = _HIDDEN_BLOCK.sub(" ", text)
+    text = _BLOCK_TAG.sub("\n", text)
+    return html.unescape(_TAG.sub(" ", text))
+
+
+class ContextBuilder:
+    """
+    Builds the embedded text for a meeting and counts what cleaning and the budget removed
+    With clean=False and max_tokens=None it reproduces the original raw context exactly
+    """
+
+    def __init__(self, tokenizer=None, max_tokens: Optional[int] = None, clean: bool = False):
+        if max_tokens is not None and tokenizer is None:
+            raise ValueError("A token budget needs the model's tokenizer")
+        self.tokenizer = tokenizer
+        self.max_tokens = max_tokens
+        self.clean = clean
+        self.stats = {
+            "texts": 0, "chars_in": 0, "chars_out": 0,
+            "html_stripped": 0, "footers_removed": 0, "truncated": 0, "tokens_cut": 0
+        }
+
+    def clean_description(self, description: str) -> str:
+        """Remove markup, join boilerplate and links; collapse whitespace"""
+        if "<" in description and _TAG.search(description):
+            description = strip_html(description)
+            self.stats["html_stripped"] += 1
+        footer = _FOOTER.search(description)
+        if footer:
+            description = description[:self._footer_start(description, footer.start())]
+            self.stats["footers_removed"] += 1
+        description = _URL.sub(" ", description)
+        return _WHITESPACE.sub(" ", description).strip()
+
+    @staticmethod
+    def _footer_start(description: str, marker: int) -> int:
+        """Start of the join block: the rule line right above the marker if there is one, else the marker"""
+        for rule in _RULE.finditer(description, 0, marker):
+            between = description[rule.end():marker]
+            if between.count("\n") <= _RULE_MAX_LINES and len(between) <= _RULE_MAX_CHARS:
+                return rule.start()
+        return marker
+
+    def _frame(self, title: str, attendee_count: Optional[int]):
+        prefix = f"Meeting: {title}"
+        suffix = f". {attendee_count} attendees" if attendee_count else ""
+        return prefix, suffix
+
+    def build_batch(
+        self,
+        titles: List[str],
+        descriptions: List[Optional[str]],
+        attendee_counts: List[Optional[int]]
+    ) -> List[str]:
+        """Contexts for parallel lists of meeting fields"""
+        raw_chars = sum(
+            len(prefix) + len(suffix) + (len(d) + 2 if d else 0)
+            for (prefix, suffix), d in zip(map(self._frame, titles, attendee_counts), descriptions)
+        )
+        if self.clean:
+            titles = [_WHITESPACE.sub(" ", title or "").strip() for title in titles]
+            descriptions = [self.clean_description(d) if d else d for d in descriptions]
+        descriptions = list(descriptions)
+
+        if self.max_tokens is not None:
+            self._apply_budget(titles, descriptions, attendee_counts)
+
+        contexts = []
+        for title, description, count in zip(titles, descriptions, attendee_counts):
+            prefix, suffix = self._frame(title, count)
+            contexts.append(prefix + (f". {description}" if description else "") + suffix)
+
+        self.stats["texts"] += len(contexts)
+        self.stats["chars_in"] += raw_chars
+        self.stats["chars_out"] += sum(len(c) for c in contexts)
+        return contexts
+
+    def _apply_budget(self, titles: List[str], descriptions: List[Optional[str]], attendee_counts: List[Optional[int]]):
+        """Cut descriptions in place so each whole context fits in max_tokens"""
+        # Title and attendee count are never cut; only these descriptions can exceed their share
+        frames = [self._frame(t, c) for t, c in zip(titles, attendee_counts)]
+        frame_tokens = [
+            len(ids) for ids in self.tokenizer([p + s for p, s in frames], add_special_tokens=True)["input_ids"]
+        ]
+        # Every token covers at least one UTF-8 byte, so shorter descriptions fit without tokenizing;
+        # the budget keeps one extra token for the ". " joining description and title
+        candidates = [
+            i for i, d in enumerate(descriptions)
+            if d and len(d.encode("utf-8")) > self.max_tokens - frame_tokens[i] - 1
+        ]
+        if not candidates:
+            return
+
+        encoded = self.tokenizer(
+            [descriptions[i] for i in candidates],
+            add_special_tokens=False,
+            return_offsets_mapping=True
+        )
+        for i, ids, offsets in zip(candidates, encoded["input_ids"], encoded["offset_mapping"]):
+            # One extra token for the ". " joining description and title
+            budget = max(0, self.max_tokens - frame_tokens[i] - 1)
+            if len(ids) <= budget:
+                continue
+            self.stats["truncated"] += 1
+            self.stats["tokens_cut"] += len(ids) - budget
+            descriptions[i] = descriptions[i][:offsets[budget - 1][1]].rstrip() if budget else ""
+
+    def summary(self) -> str:
+        """One-line report of what cleaning and the budget removed"""
+        s = self.stats
+        kept = s["chars_out"] / s["chars_in"] if s["chars_in"] else 1.0
+        return (
+            f"Context: {s['texts']} texts, {kept:.0%} of characters kept, "
+            f"{s['html_stripped']} HTML stripped, {s['footers_removed']} join footers removed, "
+            f"{s['truncated']} truncated ({s['tokens_cut']} tokens cut)"
+        )
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Content-addressed embedding cache
+In-memory LRU in front of a SQLite store, keyed by model revision + context hash
+"""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+def model_revision(model_path: str) -> str:
+    """Fingerprint a local model directory from its config and weight files"""
+    model_dir = Path(model_path)
+    digest = hashlib.sha256()
+
+    config_file = model_dir / "config.json"
+    if config_file.exists():
+        digest.update(config_file.read_bytes())
+
+    # Weight files are too large to hash on every start; name + size + mtime is enough
+    for weight_file in sorted(model_dir.glob("*.safetensors")) + sorted(model_dir.glob("*.bin")):
+        stat = weight_file.stat()
+        digest.update(f"{weight_file.name}:{stat.st_size}:{int(stat.st_mtime)}".encode())
+
+    return digest.hexdigest()[:16]
+
+
+class EmbeddingCache:
+    """Two-level embedding cache: bounded in-memory LRU backed by SQLite with size-based eviction"""
+
+    def __init__(
+        self,
+        path: Optional[str],
+        model_key: str,
+        memory_entries: int = 4096,
+        max_disk_mb: float = 256
+    ):
+        self.model_key = model_key
+        self.memory_entries = memory_entries
+        self.max_disk_bytes = int(max_disk_mb * 1024 * 1024)
+
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        # misses counts lookups; stored counts the unique texts that were actually embedded
+        self.stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "stored": 0, "evictions": 0}
+
+        self._db = None
+        if path:
+            db_path = Path(path)
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(str(db_path), check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                " key TEXT PRIMARY KEY,"
+                " vector BLOB NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " last_used REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS idx_last_used ON embeddings(last_used)")
+            self._db.commit()
+
+    def key(self, text: str) -> str:
+        """Cache key for a context string under the current model"""
+        text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{self.model_key}:{text_hash}"
+
+    def get_many(self, texts: List[str]) -> Dict[int, np.ndarray]:
+        """Look up texts; returns {index: embedding} for the ones that were cached"""
+        found = {}
+        disk_lookups = {}
+
+        with self._lock:
+            for i, text in enumerate(texts):
+                key = self.key(text)
+                if key in self._memory:
+                    self._memory.move_to_end(key)
+                    found[i] = self._memory[key]
+                    self.stats["memory_hits"] += 1
+                else:
+                    disk_lookups.setdefault(key, []).append(i)
+
+            if disk_lookups and self._db is not None:
+                keys = list(disk_lookups)
+                now = time.time()
+                # Chunk to stay under SQLite's bound-parameter limit
+                for start in range(0, len(keys), 500):
+                    chunk = keys[start:start + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = self._db.execute(
+                        f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})", chunk
+                    ).fetchall()
+                    for key, blob in rows:
+                        vector = np.frombuffer(blob, dtype=np.float32)
+                        self._remember(key, vector)
+                        for i in disk_lookups.pop(key):
+                            found[i] = vector
+                            self.stats["disk_hits"] += 1
+                    self._db.executemany(
+                        "UPDATE embeddings SET last_used = ? WHERE key = ?",
+                        [(now, key) for key, _ in rows]
+                    )
+                self._db.commit()
+
+            self.stats["misses"] += sum(len(indices) for indices in disk_lookups.values())
+
+        return found
+
+    def put_many(self, texts: List[str], embeddings: np.ndarray):
+        """Store freshly computed embeddings for texts"""
+        with self._lock:
+            now = time.time()
+            rows = []
+            for text, embedding in zip(texts, embeddings):
+                key = self.key(text)
+                vector = np.ascontiguousarray(embedding, dtype=np.float32)
+                self._remember(key, vector)
+                blob = vector.tobytes()
+                rows.append((key, blob, len(blob), now))
+
+            self.stats["stored"] += len(rows)
+            if self._db is not None and rows:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector, size, last_used) VALUES (?, ?, ?, ?)",
+                    rows
+                )
+                self._evict_disk()
+                self._db.commit()
+
+    def _remember(self, key: str, vector: np.ndarray):
+        """Insert into the in-memory LRU, dropping the least recently used entries"""
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def _evict_disk(self):
+        """Delete least recently used rows until the store fits max_disk_bytes"""
+        total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM embeddings").fetchone()[0]
+        if total <= self.max_disk_bytes:
+            return
+
+        excess = total - self.max_disk_bytes
+        freed = 0
+        victims = []
+        for key, size in self._db.execute("SELECT key, size FROM embeddings ORDER BY last_used ASC"):
+            victims.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+
+        self._db.executemany("DELETE FROM embeddings WHERE key = ?", victims)
+        self.stats["evictions"] += len(victims)
+        for (key,) in victims:
+            self._memory.pop(key, None)
+
+    def summary(self) -> str:
+        """One-line hit/miss report"""
+        hits = self.stats["memory_hits"] + self.stats["disk_hits"]
+        lookups = hits + self.stats["misses"]
+        rate = (hits / lookups * 100) if lookups else 0.0
+        return (
+            f"Embedding cache: {hits}/{lookups} hits ({rate:.0f}%), "
+            f"{self.stats['memory_hits']} memory, {self.stats['disk_hits']} disk, "
+            f"{self.stats['misses']} misses, {self.stats['stored']} unique texts embedded, "
+            f"{self.stats['evictions']} evicted"
+        )
+
+    def close(self):
+        """Close the backing store"""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
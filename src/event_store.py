@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Local SQLite store for calendar events and the Graph delta sync state
+"""
+
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+def _utc_key(date_time: str) -> str:
+    """Sortable 'YYYY-MM-DDTHH:MM:SS' prefix of a Graph UTC dateTime"""
+    return (date_time or "")[:19]
+
+
+class EventStore:
+    """Events keyed by Graph id, plus one row of delta sync state"""
+
+    def __init__(self, path: str):
+        db_path = Path(path)
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(db_path))
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS events ("
+            " id TEXT PRIMARY KEY,"
+            " start_utc TEXT NOT NULL,"
+            " end_utc TEXT NOT NULL,"
+            " data TEXT NOT NULL,"
+            " updated REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_events_start ON events(start_utc)")
+        self._db.execute("CREATE TABLE IF NOT EXISTS sync_state (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self._db.commit()
+
+    def get_state(self) -> Optional[Dict[str, Any]]:
+        """Last saved delta state, or None before the first full sync"""
+        row = self._db.execute("SELECT value FROM sync_state WHERE key = 'delta'").fetchone()
+        return json.loads(row[0]) if row else None
+
+    def apply_sync(
+        self,
+        upserts: List[Dict],
+        deleted_ids: List[str],
+        state: Dict[str, Any],
+        reset: bool = False
+    ):
+        """Apply one sync round (and its new delta state) in a single transaction"""
+        now = time.time()
+        with self._db:
+            if reset:
+                self._db.execute("DELETE FROM events")
+            self._db.executemany(
+                "INSERT OR REPLACE INTO events (id, start_utc, end_utc, data, updated) VALUES (?, ?, ?, ?, ?)",
+                [
+                    (
+                        event["id"],
+                        _utc_key(event.get("start", {}).get("dateTime")),
+                        _utc_key(event.get("end", {}).get("dateTime")),
+                        json.dumps(event),
+                        now
+                    )
+                    for event in upserts
+                ]
+            )
+            self._db.executemany("DELETE FROM events WHERE id = ?", [(event_id,) for event_id in deleted_ids])
+            self._db.execute(
+                "INSERT OR REPLACE INTO sync_state (key, value) VALUES ('delta', ?)",
+                (json.dumps(state),)
+            )
+
+    def events_between(self, start_utc: str, end_utc: str) -> List[Dict]:
+        """Events starting at or after start_utc and ending at or before end_utc, oldest first"""
+        rows = self._db.execute(
+            "SELECT data FROM events WHERE start_utc >= ? AND end_utc <= ? ORDER BY start_utc",
+            (_utc_key(start_utc), _utc_key(end_utc))
+        )
+        return [json.loads(data) for (data,) in rows]
+
+    def count(self) -> int:
+        return self._db.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+    def close(self):
+        self._db.close()
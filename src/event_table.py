@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Columnar view of a local calendar export: NumPy datetime64 start/end columns plus index columns,
+so date-range filtering, series grouping and weekly stats run as array operations
+"""
+
+import json
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .meeting import Meeting, parse_graph_datetime
+from .metrics import METRICS
+
+# Microsecond resolution holds Graph's 7-digit timestamps to within a tick
+_UNIT = "datetime64[us]"
+# Time with a UTC designator or offset, e.g. ...T10:00:00Z or ...T10:00:00.1234567+02:00
+_ZONED = re.compile(r"T[^Z+-]*(Z|[+-]\d{2}:?\d{2})$", re.IGNORECASE)
+
+
+def _datetime_column(values: List[str]) -> Tuple[np.ndarray, int]:
+    """datetime64 array (UTC, NaT where missing or malformed) and the number of malformed strings"""
+    # NumPy's parsing of 'Z'/offsets is deprecated: convert those rows to naive UTC first
+    # (Graph sends naive UTC when asked to, so this is usually a no-op)
+    values = list(values)
+    malformed = 0
+    for i, value in enumerate(values):
+        if value and _ZONED.search(value):
+            parsed = parse_graph_datetime(value)
+            values[i] = parsed.isoformat() if parsed else ''
+            malformed += parsed is None
+    try:
+        return np.array(values, dtype=_UNIT), malformed
+    except ValueError:
+        pass
+    # Some string is malformed: parse one by one so only that row becomes NaT
+    column = np.empty(len(values), dtype=_UNIT)
+    for i, value in enumerate(values):
+        try:
+            column[i] = np.datetime64(value, "us")
+        except ValueError:
+            column[i] = np.datetime64("NaT")
+            malformed += 1
+    return column, malformed
+
+
+def _event_time(event: Dict, key: str) -> str:
+    value = event.get(key)
+    return (value.get('dateTime') if isinstance(value, dict) else value) or ''
+
+
+class EventTable:
+    """
+    Events of one export with column arrays aligned to `events`:
+    start/end (datetime64[us], UTC), attendees (counts), series (index into series_ids, -1 if none)
+    """
+
+    def __init__(self, events: List[Dict]):
+        self.events = events
+        starts = [_event_time(e, 'start') for e in events]
+        self.start, self.malformed = _datetime_column(starts)
+        self.end, _ = _datetime_column([_event_time(e, 'end') for e in events])
+        self.missing = sum(1 for s in starts if not s)
+        self.attendees = np.fromiter(
+            (len(a) if isinstance(a, list) else 0 for a in (e.get('attendees') for e in events)),
+            dtype=np.int32,
+            count=len(events)
+        )
+        series = np.array([e.get('seriesMasterId') or '' for e in events], dtype=str)
+        self.series_ids, codes = np.unique(series, return_inverse=True)
+        self.series = codes.astype(np.int32)
+        # '' sorts first; shift so events outside a series get -1
+        if len(self.series_ids) and self.series_ids[0] == '':
+            self.series_ids = self.series_ids[1:]
+            self.series -= 1
+
+    @classmethod
+    def load(cls, path: str) -> "EventTable":
+        """Table for a JSON export (a Graph response, {'events': [...]} or a bare list)"""
+        with open(path, 'r') as f:
+            with METRICS.timer("json_load"):
+                data = json.load(f)
+        events = data.get('events', data.get('value', data)) if isinstance(data, dict) else data
+        return cls(events)
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    @property
+    def unparseable(self) -> int:
+        """Events without a usable start time (missing or malformed)"""
+        return self.missing + self.malformed
+
+    def in_range(self, start: datetime, end: datetime) -> np.ndarray:
+        """Boolean mask of events starting within [start, end]; NaT rows never match"""
+        return (self.start >= np.datetime64(start, "us")) & (self.start <= np.datetime64(end, "us"))
+
+    def meetings(self, mask: Optional[np.ndarray] = None) -> List[Meeting]:
+        """Records for the selected rows, reusing the parsed start column"""
+        indices = np.flatnonzero(mask) if mask is not None else np.arange(len(self.events))
+        starts = self.start[indices].tolist()
+        return [Meeting.from_event(self.events[i], start=start) for i, start in zip(indices.tolist(), starts)]
+
+    def series_sizes(self, mask: Optional[np.ndarray] = None) -> Dict[str, int]:
+        """Occurrence count per recurring series among the selected rows"""
+        codes = self.series if mask is None else self.series[mask]
+        counts = np.bincount(codes[codes >= 0], minlength=len(self.series_ids))
+        return {str(self.series_ids[i]): int(counts[i]) for i in np.flatnonzero(counts)}
+
+    def weekly_stats(self, mask: Optional[np.ndarray] = None) -> Dict[str, Any]:
+        """Meetings and attendees per week (weeks start on Monday) among the selected rows"""
+        valid = ~np.isnat(self.start) if mask is None else mask & ~np.isnat(self.start)
+        # datetime64[W] weeks start on Thursday (1970-01-01); shift by 3 days to start them on Monday
+        shift = np.timedelta64(3, "D")
+        weeks = (self.start[valid].astype("datetime64[D]") + shift).astype("datetime64[W]").astype("datetime64[D]") - shift
+        labels, inverse, counts = np.unique(weeks, return_inverse=True, return_counts=True)
+        attendees = np.bincount(inverse, weights=self.attendees[valid], minlength=len(labels))
+        busiest = int(np.argmax(counts)) if len(counts) else None
+        return {
+            "weeks": len(labels),
+            "meetings_per_week_mean": float(counts.mean()) if len(counts) else 0.0,
+            "meetings_per_week_median": float(np.median(counts)) if len(counts) else 0.0,
+            "busiest_week": str(labels[busiest]) if busiest is not None else None,
+            "busiest_week_meetings": int(counts[busiest]) if busiest is not None else 0,
+            "per_week": {
+                str(label): {"meetings": int(count), "attendees": int(total)}
+                for label, count, total in zip(labels, counts, attendees)
+            }
+        }
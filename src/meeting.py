@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Compact meeting record parsed once from a Graph event and shared by every pipeline stage
+"""
+
+import re
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+# Graph sends 7 fractional digits; fromisoformat before Python 3.11 accepts at most 6
+_FRACTION = re.compile(r"(\.\d{6})\d+")
+
+
+def parse_graph_datetime(value: Any) -> Optional[datetime]:
+    """Naive UTC datetime from a Graph/ISO timestamp ('Z', offsets and 7-digit fractions allowed), or None"""
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        dt = datetime.fromisoformat(_FRACTION.sub(r"\1", value.strip().replace('Z', '+00:00')))
+    except ValueError:
+        return None
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+class Meeting:
+    """
+    The fields the pipeline reads from an event, extracted once
+    subject/location/organizer_name are None when the event has no such field, so callers keep
+    their own defaults; `raw` holds the original event until the caller releases it
+    """
+
+    __slots__ = (
+        "id", "start", "start_text", "subject", "description", "attendee_count",
+        "organizer_email", "organizer_name", "location",
+        "series_id", "is_cancelled", "is_all_day", "show_as", "response", "raw"
+    )
+
+    def __init__(
+        self,
+        id: Optional[str],
+        start: Optional[datetime],
+        start_text: str,
+        subject: Optional[str],
+        description: str,
+        attendee_count: int,
+        organizer_email: str = "",
+        organizer_name: Optional[str] = None,
+        location: Optional[str] = None,
+        series_id: Optional[str] = None,
+        is_cancelled: bool = False,
+        is_all_day: bool = False,
+        show_as: Optional[str] = None,
+        response: Optional[str] = None,
+        raw: Optional[Dict] = None
+    ):
+        self.id = id
+        self.start = start
+        self.start_text = start_text
+        self.subject = subject
+        self.description = description
+        self.attendee_count = attendee_count
+        self.organizer_email = organizer_email
+        self.organizer_name = organizer_name
+        self.location = location
+        self.series_id = series_id
+        self.is_cancelled = is_cancelled
+        self.is_all_day = is_all_day
+        self.show_as = show_as
+        self.response = response
+        self.raw = raw
+
+    @classmethod
+    def from_event(cls, event: Dict, keep_raw: bool = True, start: Optional[datetime] = None) -> "Meeting":
+        """
+        Record for one Graph event (exports with a bare string `start` are accepted too)
+        Pass `start` when the timestamp was already parsed, e.g. by EventTable
+        """
+        start_text = event.get('start')
+        start_text = (start_text.get('dateTime') if isinstance(start_text, dict) else start_text) or ''
+        organizer = (event.get('organizer') or {}).get('emailAddress') or {}
+        location = event.get('location')
+        attendees = event.get('attendees')
+        return cls(
+            id=event.get('id'),
+            start=start if start is not None else parse_graph_datetime(start_text),
+            start_text=start_text,
+            subject=event.get('subject'),
+            description=event.get('bodyPreview') or '',
+            attendee_count=len(attendees) if isinstance(attendees, list) else 0,
+            organizer_email=organizer.get('address') or '',
+            organizer_name=organizer.get('name'),
+            location=location.get('displayName') if isinstance(location, dict) else None,
+            series_id=event.get('seriesMasterId'),
+            is_cancelled=bool(event.get('isCancelled')),
+            is_all_day=bool(event.get('isAllDay')),
+            show_as=event.get('showAs'),
+            response=(event.get('responseStatus') or {}).get('response'),
+            raw=event if keep_raw else None
+        )
+
+    def __repr__(self) -> str:
+        return f"Meeting(id={self.id!r}, start={self.start_text!r}, subject={self.subject!r})"
+
+
+def ingest(events: Iterable[Dict], keep_raw: bool = True) -> List[Meeting]:
+    """Convert Graph events to records"""
+    return [Meeting.from_event(event, keep_raw) for event in events]
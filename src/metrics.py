@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Process-wide stage timers and counters, plus the --profile/--cprofile flags
+Timers are cheap enough to stay on; the breakdown is only printed when profiling is requested
+"""
+
+import argparse
+import json
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+
+class Metrics:
+    """Named timers (total seconds and call count) and counters; safe to use from fetch threads"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.timers: Dict[str, list] = {}
+            self.counters: Dict[str, int] = {}
+            self._started = time.perf_counter()
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def add_time(self, name: str, seconds: float):
+        with self._lock:
+            entry = self.timers.setdefault(name, [0.0, 0])
+            entry[0] += seconds
+            entry[1] += 1
+
+    def count(self, name: str, n: int = 1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def report(self) -> Dict[str, Any]:
+        """Snapshot: wall time since reset, per-stage totals/calls/means, counters"""
+        with self._lock:
+            return {
+                "wall_s": time.perf_counter() - self._started,
+                "stages": {
+                    name: {"total_s": total, "calls": calls, "mean_ms": total / calls * 1000 if calls else 0.0}
+                    for name, (total, calls) in self.timers.items()
+                },
+                "counters": dict(self.counters)
+            }
+
+    def format_report(self) -> str:
+        """Per-stage breakdown table, slowest stage first"""
+        report = self.report()
+        wall = report["wall_s"] or 1e-9
+        lines = [f"{'Stage':<20} {'Total s':>9} {'% wall':>7} {'Calls':>7} {'Mean ms':>9}"]
+        for name, stage in sorted(report["stages"].items(), key=lambda item: item[1]["total_s"], reverse=True):
+            lines.append(
+                f"{name:<20} {stage['total_s']:>9.3f} {stage['total_s'] / wall:>7.1%} "
+                f"{stage['calls']:>7} {stage['mean_ms']:>9.2f}"
+            )
+        lines.append(f"{'wall':<20} {report['wall_s']:>9.3f}")
+        if report["counters"]:
+            lines.append("Counters: " + ", ".join(f"{k}={v}" for k, v in sorted(report["counters"].items())))
+        return "\n".join(lines)
+
+
+# Shared by every module in the pipeline
+METRICS = Metrics()
+
+
+def add_profile_args(parser: argparse.ArgumentParser):
+    """Add --profile and --cprofile flags"""
+    group = parser.add_argument_group("profiling options")
+    group.add_argument(
+        "--profile",
+        nargs="?",
+        const="output/profile.json",
+        default=None,
+        metavar="JSON",
+        help="Print a per-stage timing breakdown and save it as JSON (default: output/profile.json)"
+    )
+    group.add_argument(
+        "--cprofile",
+        default=None,
+        metavar="PROF",
+        help="Also record a cProfile trace (pstats format; view with snakeviz or python -m pstats)"
+    )
+
+
+@contextmanager
+def profiling(args: argparse.Namespace) -> Iterator[None]:
+    """Wrap a CLI run: reset timers, optionally run cProfile, report on the way out (also on sys.exit)"""
+    METRICS.reset()
+    profiler = None
+    if getattr(args, "cprofile", None):
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    try:
+        yield
+    finally:
+        if profiler:
+            profiler.disable()
+            Path(args.cprofile).parent.mkdir(parents=True, exist_ok=True)
+            profiler.dump_stats(args.cprofile)
+            print(f"\n🔬 cProfile stats saved to {args.cprofile}")
+        if getattr(args, "profile", None):
+            print(f"\n⏱️  Stage breakdown:\n{METRICS.format_report()}")
+            _save_report(args.profile)
+
+
+def _save_report(path: Optional[str]):
+    output = Path(path)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(METRICS.report(), f, indent=2)
+    print(f"💾 Profile saved to {output}")
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Score drift check for reduced-precision inference and context cleaning
+Compares a bf16/int8 and/or cleaned-context classifier against the fp32, raw-context
+setup the calibration was fitted on
+"""
+
+import random
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+
+def sample_indices(total: int, sample_size: int, seed: int = 0) -> List[int]:
+    """Deterministic sample of meeting positions"""
+    if sample_size >= total:
+        return list(range(total))
+    return sorted(random.Random(seed).sample(range(total), sample_size))
+
+
+def precision_drift(
+    reference: List[Dict[str, Any]],
+    candidate: List[Dict[str, Any]]
+) -> Dict[str, float]:
+    """Compare analyze_batch() results from the fp32 reference and a reduced-precision candidate"""
+    ref_scores = np.array([r["score"] for r in reference], dtype=np.float64)
+    cand_scores = np.array([c["score"] for c in candidate], dtype=np.float64)
+    drift = np.abs(cand_scores - ref_scores)
+
+    agreement = np.mean([r["category"] == c["category"] for r, c in zip(reference, candidate)])
+    correlation = float(np.corrcoef(ref_scores, cand_scores)[0, 1]) if len(ref_scores) > 1 and ref_scores.std() > 0 else 1.0
+
+    return {
+        "meetings": len(reference),
+        "mean_abs_drift": float(drift.mean()) if len(drift) else 0.0,
+        "p95_abs_drift": float(np.percentile(drift, 95)) if len(drift) else 0.0,
+        "max_abs_drift": float(drift.max()) if len(drift) else 0.0,
+        "category_agreement": float(agreement) if len(reference) else 1.0,
+        "score_correlation": correlation
+    }
+
+
+def check_precision(
+    model_path: str,
+    candidate,
+    titles: List[str],
+    descriptions: List[Optional[str]],
+    attendee_counts: List[Optional[int]],
+    sample_size: int = 200,
+    batch_size: int = 32
+) -> Dict[str, float]:
+    """Score a sample with the candidate and a freshly loaded fp32, raw-context classifier and report drift"""
+    from .classifier import SimpleQwen3Classifier
+
+    indices = sample_indices(len(titles), sample_size)
+    sample = (
+        [titles[i] for i in indices],
+        [descriptions[i] for i in indices],
+        [attendee_counts[i] for i in indices]
+    )
+
+    # Same categories and anchor bundles as the candidate, so only precision and context differ
+    reference = SimpleQwen3Classifier(
+        model_path,
+        pooling=candidate.pooling,
+        precision="fp32",
+        categories=candidate.categories,
+        anchor_dir=str(candidate.anchor_dir)
+    )
+    ref_results = reference.analyze_batch(*sample, batch_size=batch_size)
+    cand_results = candidate.analyze_batch(*sample, batch_size=batch_size)
+    return precision_drift(ref_results, cand_results)
+
+
+def format_drift(report: Dict[str, float], label: str) -> str:
+    """Human-readable drift summary"""
+    return (
+        f"{label} vs fp32 on {report['meetings']} meetings: "
+        f"mean |Δscore| {report['mean_abs_drift']:.2f}, p95 {report['p95_abs_drift']:.2f}, "
+        f"max {report['max_abs_drift']:.2f}, category agreement {report['category_agreement']:.0%}, "
+        f"score correlation {report['score_correlation']:.3f}"
+    )
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Rule-based pre-filter and series dedup run before meetings reach the embedding model
+"""
+
+import argparse
+import re
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .meeting import Meeting
+
+# Subjects of calendar blocks that are never worth a workback plan
+_BLOCK_SUBJECT = re.compile(
+    r"^\s*(oof|ooo|out of (the )?office|focus (time|block)|vacation|holiday|pto)\b",
+    re.IGNORECASE
+)
+# Reply/forward/update prefixes Outlook adds to a series' subject
+_SUBJECT_PREFIX = re.compile(r"^\s*((re|fw|fwd|updated|canceled|cancelled)\s*:\s*)+", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _too_few_attendees(meeting: Meeting) -> bool:
+    return meeting.attendee_count < 2
+
+
+def _cancelled(meeting: Meeting) -> bool:
+    return meeting.is_cancelled
+
+
+def _declined(meeting: Meeting) -> bool:
+    return meeting.response == 'declined'
+
+
+def _all_day(meeting: Meeting) -> bool:
+    # Only all-day blocks: offsites and conferences are all-day events too
+    return meeting.is_all_day and (
+        meeting.show_as in ('oof', 'free') or bool(_BLOCK_SUBJECT.match(meeting.subject or ''))
+    )
+
+
+def _blocker(meeting: Meeting) -> bool:
+    return meeting.show_as == 'oof' or bool(_BLOCK_SUBJECT.match(meeting.subject or ''))
+
+
+# Rule name -> predicate returning True when the meeting should be skipped
+PREFILTER_RULES: Dict[str, Callable[[Meeting], bool]] = {
+    "too_few_attendees": _too_few_attendees,
+    "cancelled": _cancelled,
+    "declined": _declined,
+    "all_day": _all_day,
+    "blocker": _blocker
+}
+DEFAULT_RULES = tuple(PREFILTER_RULES)
+
+
+def normalize_subject(subject: str) -> str:
+    """Case- and whitespace-insensitive subject without RE:/FW:/Updated: prefixes"""
+    return _WHITESPACE.sub(" ", _SUBJECT_PREFIX.sub("", subject or "")).strip().casefold()
+
+
+def series_key(meeting: Meeting) -> Tuple:
+    """
+    Meetings with equal keys are scored once
+    Occurrences of a recurring series share seriesMasterId; otherwise the model input
+    (normalized subject, description, attendee count) has to match
+    """
+    if meeting.series_id:
+        return ("series", meeting.series_id)
+    return ("subject", normalize_subject(meeting.subject), meeting.description.strip(), meeting.attendee_count)
+
+
+class MeetingPrefilter:
+    """Applies the enabled rules in order; the first matching rule is counted as the reason"""
+
+    def __init__(self, rules: Optional[Iterable[str]] = None, dedup_series: bool = True):
+        rules = DEFAULT_RULES if rules is None else tuple(rules)
+        unknown = [name for name in rules if name not in PREFILTER_RULES]
+        if unknown:
+            raise ValueError(f"Unknown pre-filter rules {unknown}, expected any of {DEFAULT_RULES}")
+        self.rules = rules
+        self.dedup_series = dedup_series
+        self.skipped = {name: 0 for name in rules}
+        self.series_repeats = 0
+        self.scored = 0
+        self._first_of_series: Dict[Tuple, int] = {}
+
+    def skip_reason(self, meeting: Meeting) -> Optional[str]:
+        for name in self.rules:
+            if PREFILTER_RULES[name](meeting):
+                return name
+        return None
+
+    def apply(self, meetings: Iterable[Meeting]) -> Tuple[List[Meeting], List[Meeting], List[int]]:
+        """
+        Drop skipped meetings and collapse series repeats
+        Can be called once per page; series are tracked across calls
+        Returns: (kept meetings, meetings to score, and for each kept meeting the index
+                  into all meetings to score so far whose result it shares)
+        """
+        kept: List[Meeting] = []
+        to_score: List[Meeting] = []
+        representative: List[int] = []
+        first_of_series = self._first_of_series
+        for meeting in meetings:
+            reason = self.skip_reason(meeting)
+            if reason:
+                self.skipped[reason] += 1
+                continue
+            kept.append(meeting)
+            if self.dedup_series:
+                key = series_key(meeting)
+                if key in first_of_series:
+                    self.series_repeats += 1
+                    representative.append(first_of_series[key])
+                    continue
+                first_of_series[key] = self.scored
+            representative.append(self.scored)
+            to_score.append(meeting)
+            self.scored += 1
+        return kept, to_score, representative
+
+    def summary(self) -> str:
+        """One-line report of skip counts per rule and series repeats"""
+        counts = ", ".join(f"{name} {count}" for name, count in self.skipped.items() if count)
+        return (
+            f"Pre-filter skipped {sum(self.skipped.values())} ({counts or 'none'}); "
+            f"{self.series_repeats} series repeats reused a score"
+        )
+
+
+def add_prefilter_args(parser: argparse.ArgumentParser):
+    """Add pre-filter rule selection and series dedup flags"""
+    group = parser.add_argument_group("pre-filter options")
+    group.add_argument(
+        "--skip-rules",
+        default=",".join(DEFAULT_RULES),
+        help=f"Comma-separated rules for meetings skipped before scoring, or 'none' (default: {','.join(DEFAULT_RULES)})"
+    )
+    group.add_argument("--no-series-dedup", action="store_true", help="Score every occurrence of a recurring series separately")
+
+
+def prefilter_options(args: argparse.Namespace) -> Dict[str, Any]:
+    """Keyword arguments for MeetingPrefilter from parsed flags"""
+    rules = [] if args.skip_rules.strip().lower() == "none" else [r.strip() for r in args.skip_rules.split(",") if r.strip()]
+    return {"rules": rules, "dedup_series": not args.no_series_dedup}
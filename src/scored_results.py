@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Scored report meetings saved next to the HTML, so the report can be rebuilt without the model
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from .meeting import Meeting
+
+SCORED_VERSION = 1
+
+
+def scored_path(user_email: str) -> Path:
+    """Default location, next to output/mimic_<alias>.html"""
+    return Path("output") / f"mimic_{user_email.split('@')[0]}_scored.json"
+
+
+def save_scored(path: Path, user_email: str, analyzed: List[Dict]):
+    """Write the analyzed meetings with their original Graph events"""
+    results = []
+    for item in analyzed:
+        meeting = item['meeting']
+        if meeting.raw is None:
+            raise ValueError(f"Meeting {meeting.id!r} no longer has its raw event")
+        results.append({
+            "score": float(item['score']),
+            "category": item['category'],
+            "reasoning": item['reasoning'],
+            "role": item['role'],
+            "event": meeting.raw
+        })
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(
+            {"version": SCORED_VERSION, "user": user_email, "saved": datetime.now().isoformat(), "results": results},
+            f,
+            indent=2
+        )
+
+
+def load_scored(path: Path) -> Tuple[str, List[Dict]]:
+    """(user email, analyzed meetings in the shape process_meetings returns)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if data.get("version") != SCORED_VERSION:
+        raise ValueError(f"Unsupported scored results version {data.get('version')!r} in {path}")
+    analyzed = [
+        {
+            "meeting": Meeting.from_event(result['event']),
+            "score": result['score'],
+            "category": result['category'],
+            "reasoning": result['reasoning'],
+            "role": result['role']
+        }
+        for result in data['results']
+    ]
+    return data['user'], analyzed
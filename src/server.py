@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Local HTTP scoring service around SimpleQwen3Classifier
+One warm model serves every CLI run; ScoringClient is the thin client side
+"""
+
+import json
+import threading
+import traceback
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Optional
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+
+
+class ScoringRequestHandler(BaseHTTPRequestHandler):
+    """
+    GET  /health      -> model info and counters
+    POST /score       -> {"title", "description", "attendee_count"} -> analysis
+    POST /score_batch -> {"meetings": [...], "batch_size"} -> {"results": [...]}
+    """
+
+    # Set on the server instance by make_server()
+    server: "ScoringServer"
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(200, self.server.health())
+        else:
+            self._send_json(404, {"error": f"Unknown endpoint {self.path}"})
+
+    def do_POST(self):
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except (ValueError, json.JSONDecodeError) as e:
+            self._send_json(400, {"error": f"Invalid JSON body: {e}"})
+            return
+        if not isinstance(payload, dict):
+            self._send_json(400, {"error": "JSON body must be an object"})
+            return
+
+        try:
+            if self.path == "/score":
+                result = self.server.score_batch([payload])[0]
+            elif self.path == "/score_batch":
+                batch_size = payload.get("batch_size", 32)
+                if not isinstance(batch_size, int) or isinstance(batch_size, bool) or batch_size < 1:
+                    raise ValueError(f"batch_size must be a positive integer, got {batch_size!r}")
+                results = self.server.score_batch(payload.get("meetings", []), batch_size=batch_size)
+                result = {"results": results}
+            else:
+                self._send_json(404, {"error": f"Unknown endpoint {self.path}"})
+                return
+        except (KeyError, TypeError, ValueError) as e:
+            self._send_json(400, {"error": f"Malformed request: {e}"})
+            return
+        except Exception as e:
+            # Keep the server up; the traceback goes to the console, the client gets a JSON error
+            traceback.print_exc()
+            self._send_json(500, {"error": f"Scoring failed: {type(e).__name__}: {e}"})
+            return
+
+        self._send_json(200, result)
+
+    def _send_json(self, status: int, body: Dict[str, Any]):
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        # Keep the console for the startup banner and errors
+        pass
+
+
+class ScoringServer(ThreadingHTTPServer):
+    """HTTP server holding one classifier; forward passes are serialized behind a lock"""
+
+    daemon_threads = True
+
+    def __init__(self, address, classifier):
+        super().__init__(address, ScoringRequestHandler)
+        self.classifier = classifier
+        self._model_lock = threading.Lock()
+        self.requests_served = 0
+        self.meetings_scored = 0
+
+    @staticmethod
+    def _validate(meetings: Any) -> List[Dict[str, Any]]:
+        """Raise TypeError/ValueError for meeting lists the classifier cannot score"""
+        if not isinstance(meetings, list):
+            raise TypeError("meetings must be a list")
+        for i, m in enumerate(meetings):
+            if not isinstance(m, dict):
+                raise TypeError(f"meeting {i} must be an object")
+            if "title" not in m:
+                raise KeyError(f"meeting {i} has no title")
+            # Untitled Graph events have "subject": null; they are scored like in-process ("Meeting: None")
+            if m["title"] is not None and not isinstance(m["title"], str):
+                raise TypeError(f"meeting {i} title must be a string or null")
+            if m.get("description") is not None and not isinstance(m["description"], str):
+                raise TypeError(f"meeting {i} description must be a string")
+            count = m.get("attendee_count")
+            if count is not None and (not isinstance(count, int) or isinstance(count, bool) or count < 0):
+                raise ValueError(f"meeting {i} attendee_count must be a non-negative integer, got {count!r}")
+        return meetings
+
+    def score_batch(self, meetings: List[Dict[str, Any]], batch_size: int = 32) -> List[Dict[str, Any]]:
+        """Score meeting dicts with title/description/attendee_count keys"""
+        meetings = self._validate(meetings)
+        titles = [m["title"] for m in meetings]
+        descriptions = [m.get("description") for m in meetings]
+        attendee_counts = [m.get("attendee_count") for m in meetings]
+
+        with self._model_lock:
+            results = self.classifier.analyze_batch(titles, descriptions, attendee_counts, batch_size=batch_size)
+            self.requests_served += 1
+            self.meetings_scored += len(meetings)
+        return results
+
+    def health(self) -> Dict[str, Any]:
+        health = {
+            "status": "ok",
+            "model_key": self.classifier.model_key,
+            "pooling": self.classifier.pooling,
+            "precision": self.classifier.precision,
+            "backend": self.classifier.backend.name,
+            "requests_served": self.requests_served,
+            "meetings_scored": self.meetings_scored,
+            "padding_efficiency": self.classifier.padding_efficiency(),
+            "timings": self.classifier.timings
+        }
+        if self.classifier.cache:
+            health["cache"] = dict(self.classifier.cache.stats)
+        return health
+
+
+def make_server(classifier, host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> ScoringServer:
+    """Bind a scoring server for an already-loaded classifier"""
+    return ScoringServer((host, port), classifier)
+
+
+class ScoringClient:
+    """Drop-in stand-in for SimpleQwen3Classifier that scores through a running server"""
+
+    BUCKET_WINDOW = 8
+
+    def __init__(self, url: str = f"http://{DEFAULT_HOST}:{DEFAULT_PORT}", timeout: float = 300):
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+        # Caching happens server side
+        self.cache = None
+
+    def _request(self, path: str, payload: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        data = json.dumps(payload).encode("utf-8") if payload is not None else None
+        request = urllib.request.Request(
+            f"{self.url}{path}",
+            data=data,
+            headers={"Content-Type": "application/json"}
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return json.loads(response.read())
+        except urllib.error.HTTPError as e:
+            raise RuntimeError(f"Scoring server error {e.code}: {e.read().decode('utf-8', 'replace')}") from e
+
+    def health(self) -> Dict[str, Any]:
+        """Server status; raises if the server is not reachable"""
+        return self._request("/health")
+
+    def analyze(
+        self,
+        title: str,
+        description: Optional[str] = None,
+        attendee_count: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Same contract as SimpleQwen3Classifier.analyze"""
+        return self._request("/score", {
+            "title": title,
+            "description": description,
+            "attendee_count": attendee_count
+        })
+
+    def analyze_batch(
+        self,
+        titles: List[str],
+        descriptions: Optional[List[Optional[str]]] = None,
+        attendee_counts: Optional[List[Optional[int]]] = None,
+        batch_size: int = 32
+    ) -> List[Dict[str, Any]]:
+        """Same contract as SimpleQwen3Classifier.analyze_batch"""
+        descriptions = descriptions or [None] * len(titles)
+        attendee_counts = attendee_counts or [None] * len(titles)
+        meetings = [
+            {"title": title, "description": description, "attendee_count": count}
+            for title, description, count in zip(titles, descriptions, attendee_counts)
+        ]
+        response = self._request("/score_batch", {"meetings": meetings, "batch_size": batch_size})
+        return response["results"]
+
+    def padding_efficiency(self) -> float:
+        """Server-side padding efficiency"""
+        return self.health().get("padding_efficiency", 1.0)
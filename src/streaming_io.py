@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Streaming calendar input and NDJSON output
+Meetings are yielded one at a time, so memory stays flat regardless of export size
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterator, TextIO
+
+NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+
+_WHITESPACE = re.compile(r"\s*")
+_DECODER = json.JSONDecoder()
+
+
+def is_ndjson(path: str) -> bool:
+    """NDJSON is recognized by file extension"""
+    return Path(path).suffix.lower() in NDJSON_SUFFIXES
+
+
+class _ChunkReader:
+    """Sliding text buffer over a file that decodes one JSON value at a time"""
+
+    def __init__(self, f: TextIO, chunk_size: int):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self) -> bool:
+        data = self.f.read(self.chunk_size)
+        if not data:
+            self.eof = True
+            return False
+        # Drop everything already consumed
+        self.buf = self.buf[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Next non-whitespace character ('' at end of file)"""
+        while True:
+            self.pos = _WHITESPACE.match(self.buf, self.pos).end()
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Could not parse calendar data: expected '{char}', found '{found or 'end of file'}'")
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value, reading more input until it fits in the buffer"""
+        self.peek()
+        while True:
+            try:
+                obj, end = _DECODER.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number or literal ending exactly at the buffer edge may continue in the next chunk
+            if end == len(self.buf) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return obj
+
+    def iter_array(self) -> Iterator[Any]:
+        """Yield the elements of the array starting at the current position"""
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            char = self.peek()
+            self.pos += 1
+            if char == "]":
+                return
+            if char != ",":
+                raise ValueError(f"Could not parse calendar data: expected ',' or ']', found '{char or 'end of file'}'")
+
+
+def iter_json_events(path: str, chunk_size: int = 1 << 20) -> Iterator[Dict]:
+    """
+    Stream meetings from a JSON export: a top-level list, or a dict with an 'events'/'value' list
+    A dict without either key is treated as a single meeting, like load_calendar_data
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        reader = _ChunkReader(f, chunk_size)
+        first = reader.peek()
+        if first == "[":
+            yield from reader.iter_array()
+            return
+        if first != "{":
+            raise ValueError("Could not parse calendar data. Expected list or dict with 'events' key.")
+
+        reader.pos += 1
+        other_fields = {}
+        if reader.peek() == "}":
+            yield other_fields
+            return
+        while True:
+            key = reader.value()
+            reader.expect(":")
+            if key in ("events", "value") and reader.peek() == "[":
+                yield from reader.iter_array()
+                return
+            other_fields[key] = reader.value()
+            char = reader.peek()
+            reader.pos += 1
+            if char == "}":
+                break
+            if char != ",":
+                raise ValueError(f"Could not parse calendar data: expected ',' or '}}', found '{char or 'end of file'}'")
+        yield other_fields
+
+
+def iter_ndjson_events(path: str) -> Iterator[Dict]:
+    """Stream meetings from newline-delimited JSON, one event per line"""
+    with open(path, "r", encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSON on line {line_no} of {path}: {e}") from e
+
+
+def iter_calendar_events(path: str) -> Iterator[Dict]:
+    """Stream meetings from JSON or NDJSON input"""
+    if is_ndjson(path):
+        return iter_ndjson_events(path)
+    return iter_json_events(path)
+
+
+class NdjsonWriter:
+    """Write one JSON document per line as results are produced"""
+
+    def __init__(self, path: str, encoder_cls=None):
+        self._f = open(path, "w", encoding="utf-8")
+        self._encoder_cls = encoder_cls
+        self.count = 0
+
+    def write(self, record: Dict):
+        self._f.write(json.dumps(record, cls=self._encoder_cls))
+        self._f.write("\n")
+        self.count += 1
+
+    def close(self):
+        self._f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
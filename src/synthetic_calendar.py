@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Synthetic Graph-style calendars for benchmarks
+Subject/body length, attendee counts and the share of recurring-series occurrences are configurable;
+the same seed always produces the same calendar
+"""
+
+import random
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+_TOPICS = [
+    "quarterly business review", "product launch", "budget planning", "hiring committee",
+    "project kickoff", "executive presentation", "weekly sync", "1:1", "design review",
+    "incident postmortem", "customer escalation", "roadmap planning", "training workshop",
+    "team offsite", "board prep", "sprint planning", "architecture review", "all hands"
+]
+_WORDS = (
+    "agenda review status update metrics roadmap customer launch budget forecast risk decision "
+    "stakeholder milestone dependency timeline owner action item follow up discuss align priorities "
+    "feedback proposal draft deck slides notes outcome goal target quarter fiscal team partner "
+    "release feature bug escalation hiring candidate interview plan strategy review planning"
+).split()
+
+
+def _words(rng: random.Random, count: int) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(count))
+
+
+def generate_calendar(
+    meetings: int = 1000,
+    seed: int = 0,
+    subject_words: Tuple[int, int] = (2, 8),
+    body_words: Tuple[int, int] = (0, 120),
+    attendees: Tuple[int, int] = (1, 40),
+    recurrence_ratio: float = 0.3,
+    series_length: int = 8,
+    days: int = 180,
+    user_email: str = "bench@example.com",
+    end: Optional[datetime] = None
+) -> List[Dict]:
+    """
+    Graph-shaped events spread over the `days` before `end` (default: now, UTC)
+    About recurrence_ratio of the events are occurrences of series of series_length meetings
+    that share seriesMasterId, subject, body and attendees
+    """
+    rng = random.Random(seed)
+    end = end or datetime.utcnow()
+    events = []
+    series_count = 0
+
+    def new_meeting() -> Dict:
+        topic = rng.choice(_TOPICS)
+        extra = rng.randint(*subject_words) - len(topic.split())
+        subject = topic.title() + (" " + _words(rng, extra) if extra > 0 else "")
+        attendee_count = rng.randint(*attendees)
+        organizer = user_email if rng.random() < 0.3 else f"user{rng.randint(0, 999)}@example.com"
+        return {
+            "subject": subject,
+            "bodyPreview": _words(rng, rng.randint(*body_words)),
+            "attendees": [
+                {"emailAddress": {"address": f"user{rng.randint(0, 9999)}@example.com", "name": f"User {i}"}}
+                for i in range(attendee_count)
+            ],
+            "organizer": {"emailAddress": {"address": organizer, "name": organizer.split("@")[0]}},
+            "location": {"displayName": rng.choice(["", "Teams", f"Room {rng.randint(1, 50)}"])}
+        }
+
+    # Chance of starting a series so that about recurrence_ratio of all events are occurrences
+    series_chance = 0.0
+    if recurrence_ratio > 0:
+        series_chance = recurrence_ratio / (recurrence_ratio + series_length * (1 - recurrence_ratio))
+
+    while len(events) < meetings:
+        base = new_meeting()
+        occurrences = 1
+        if rng.random() < series_chance:
+            series_count += 1
+            base["seriesMasterId"] = f"series-{series_count}"
+            base["type"] = "occurrence"
+            occurrences = min(series_length, meetings - len(events))
+        else:
+            base["type"] = "singleInstance"
+
+        start = end - timedelta(days=rng.uniform(0, days), minutes=rng.randint(0, 59))
+        interval = timedelta(days=rng.choice([1, 7, 14]))
+        duration = timedelta(minutes=rng.choice([15, 30, 60, 90, 120]))
+        for _ in range(occurrences):
+            event = dict(base)
+            event["id"] = f"evt-{len(events)}"
+            event["start"] = {"dateTime": start.strftime("%Y-%m-%dT%H:%M:%S.0000000"), "timeZone": "UTC"}
+            event["end"] = {"dateTime": (start + duration).strftime("%Y-%m-%dT%H:%M:%S.0000000"), "timeZone": "UTC"}
+            events.append(event)
+            start = max(end - timedelta(days=days), start - interval)
+
+    return events
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Persistent MSAL token cache (owner-only file) and the sign-in flags shared by the Graph CLIs
+A cached refresh token lets later runs sign in silently, without the device code round trip
+"""
+
+import argparse
+import os
+import stat
+from pathlib import Path
+from typing import Any, Dict
+
+DEFAULT_TOKEN_CACHE = str(Path.home() / ".mimic" / "token_cache.bin")
+
+
+def _restrict(path: Path):
+    """Tighten a cache file readable by group or others to 0600 (no-op where modes are not POSIX)"""
+    if os.name != "posix":
+        return
+    mode = stat.S_IMODE(path.stat().st_mode)
+    if mode & 0o077:
+        os.chmod(path, 0o600)
+        print(f"⚠️ Token cache {path} was accessible to other users (mode {mode:o}); restricted to 0600.")
+
+
+def load_token_cache(path: str):
+    """msal.SerializableTokenCache with the tokens saved by an earlier run, if any"""
+    import msal
+
+    cache = msal.SerializableTokenCache()
+    cache_file = Path(path).expanduser()
+    if cache_file.exists():
+        _restrict(cache_file)
+        try:
+            cache.deserialize(cache_file.read_text())
+        except ValueError:
+            print(f"⚠️ Token cache {cache_file} is unreadable; signing in again.")
+    return cache
+
+
+def save_token_cache(cache, path: str):
+    """Write the cache if sign-in changed it; the file is created 0600, atomically"""
+    if not cache.has_state_changed:
+        return
+    cache_file = Path(path).expanduser()
+    cache_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    tmp = cache_file.with_name(cache_file.name + ".tmp")
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        f.write(cache.serialize())
+    # O_CREAT's mode does not apply when a stale temp file already existed
+    os.chmod(tmp, 0o600)
+    os.replace(tmp, cache_file)
+    cache.has_state_changed = False
+
+
+def add_auth_args(parser: argparse.ArgumentParser):
+    """Add token cache and non-interactive sign-in flags"""
+    group = parser.add_argument_group("sign-in options")
+    group.add_argument(
+        "--token-cache",
+        default=DEFAULT_TOKEN_CACHE,
+        help=f"MSAL token cache; later runs refresh silently from it (default: {DEFAULT_TOKEN_CACHE})"
+    )
+    group.add_argument(
+        "--account",
+        help="Account to sign in with; cached tokens are only reused for this account (default: the user's email)"
+    )
+    group.add_argument(
+        "--non-interactive",
+        action="store_true",
+        help="Fail instead of prompting when no cached sign-in can be refreshed (for scheduled runs)"
+    )
+
+
+def auth_options(args: argparse.Namespace) -> Dict[str, Any]:
+    """Keyword arguments for MimicTool from parsed flags"""
+    return {"token_cache_path": args.token_cache, "account": args.account, "interactive": not args.non_interactive}
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Streaming top-K selection with a bounded min-heap
+"""
+
+import heapq
+from itertools import count
+from typing import Any, Generic, List, TypeVar
+
+T = TypeVar("T")
+
+
+class TopK(Generic[T]):
+    """
+    Keep the k highest-scoring items seen so far in O(k) memory
+    Ties keep the earlier item, matching a stable sort by score descending
+    """
+
+    def __init__(self, k: int):
+        self.k = k
+        self.seen = 0
+        self._heap: List[Any] = []
+        self._order = count()
+
+    def push(self, score: float, item: T):
+        self.seen += 1
+        if self.k <= 0:
+            return
+        # Min-heap on (score, -arrival): the root is the lowest score, latest arrival first
+        entry = (score, -next(self._order), item)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def items(self) -> List[T]:
+        """Retained items, best first"""
+        return [item for _, _, item in sorted(self._heap, key=lambda e: e[:2], reverse=True)]
+
+    def __len__(self) -> int:
+        return len(self._heap)
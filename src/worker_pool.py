@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Process pool for SimpleQwen3Classifier forward passes
+Workers are forked after the model is loaded, so they share its weights copy-on-write
+instead of each loading its own copy
+"""
+
+import multiprocessing
+import os
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+# The loaded classifier, inherited by forked workers; never pickled
+_CLASSIFIER = None
+
+
+def _init_worker(threads: int):
+    """Runs once per worker: limit its inference threads so workers do not oversubscribe cores"""
+    _CLASSIFIER.backend = _CLASSIFIER.backend.for_worker(threads)
+
+
+def _forward_bucket(bucket: Tuple[List[List[int]], List[List[int]]]) -> np.ndarray:
+    input_ids, attention_mask = bucket
+    return _CLASSIFIER._forward_bucket(input_ids, attention_mask)
+
+
+def default_threads_per_worker(workers: int) -> int:
+    """Split the host's cores evenly across workers"""
+    return max(1, (os.cpu_count() or 1) // workers)
+
+
+class ScoringPool:
+    """Forked worker processes that each run padded batches through the shared model"""
+
+    def __init__(self, classifier, workers: int, threads_per_worker: Optional[int] = None):
+        global _CLASSIFIER
+
+        if "fork" not in multiprocessing.get_all_start_methods():
+            raise RuntimeError("Scoring workers need the 'fork' start method (Linux or macOS)")
+
+        self.workers = workers
+        self.threads_per_worker = threads_per_worker or default_threads_per_worker(workers)
+        _CLASSIFIER = classifier
+        self._pool = multiprocessing.get_context("fork").Pool(
+            workers,
+            initializer=_init_worker,
+            initargs=(self.threads_per_worker,)
+        )
+
+    def map_buckets(self, buckets: List[Tuple[List[List[int]], List[List[int]]]]) -> List[np.ndarray]:
+        """Pooled embeddings for each (input_ids, attention_mask) bucket, in order"""
+        return self._pool.map(_forward_bucket, buckets, chunksize=1)
+
+    def close(self):
+        self._pool.close()
+        self._pool.join()
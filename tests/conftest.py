@@ -0,0 +1,210 @@
+"""
+Shared fixtures: stub Graph and sign-in (token authority) servers the CLI code can be pointed at
+"""
+
+import base64
+import datetime
+import ipaddress
+import json
+import ssl
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# (status, headers, JSON body or None)
+StubResponse = Tuple[int, Dict[str, str], Optional[Dict]]
+
+
+class StubGraph:
+    """
+    Records every request and answers it with `respond(path, query)`
+    Tests replace `respond`; the default returns an empty page
+    """
+
+    def __init__(self):
+        self.requests: List[Tuple[str, Dict[str, str]]] = []
+        self.respond: Callable[[str, Dict[str, str]], StubResponse] = lambda path, query: (200, {}, {"value": []})
+        self.endpoint = ""
+        self._lock = threading.Lock()
+
+    def handle(self, raw_path: str) -> StubResponse:
+        parsed = urlparse(raw_path)
+        query = {k: v[0] for k, v in parse_qs(parsed.query).items()}
+        with self._lock:
+            self.requests.append((parsed.path, query))
+        return self.respond(parsed.path, query)
+
+
+@pytest.fixture
+def graph_server():
+    """StubGraph served on a free local port; `endpoint` stands in for GRAPH_ENDPOINT"""
+    stub = StubGraph()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            status, headers, body = stub.handle(self.path)
+            data = json.dumps(body).encode("utf-8") if body is not None else b""
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    stub.endpoint = f"http://127.0.0.1:{server.server_address[1]}/v1.0"
+    try:
+        yield stub
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _b64(data: Dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(data).encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _self_signed_cert(directory: Path) -> Tuple[Path, Path]:
+    """Certificate and key for 127.0.0.1 (MSAL only talks HTTPS)"""
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "127.0.0.1")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(minutes=5))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(x509.SubjectAlternativeName([x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]), critical=False)
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path, key_path = directory / "stub_cert.pem", directory / "stub_key.pem"
+    cert_path.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption()
+    ))
+    return cert_path, key_path
+
+
+class StubAuthority:
+    """
+    Token endpoint standing in for Entra ID: device code sign-in and refresh grants for `username`
+    `grants` lists the grant_type of every token request
+    """
+
+    CLIENT_ID = "04b07795-8ddb-461a-bbee-02f9e1bf7b46"
+
+    def __init__(self):
+        self.grants: List[str] = []
+        self.username = "me@example.com"
+        self.authority = ""
+        self._lock = threading.Lock()
+
+    def tokens(self) -> Dict:
+        now = int(time.time())
+        with self._lock:
+            serial = len(self.grants)
+        id_token = ".".join([
+            _b64({"alg": "none"}),
+            _b64({
+                "iss": f"{self.authority}/v2.0", "aud": self.CLIENT_ID, "sub": "stub", "oid": "uid", "tid": "tid",
+                "preferred_username": self.username, "iat": now, "exp": now + 3600
+            }),
+            ""
+        ])
+        return {
+            "token_type": "Bearer",
+            "scope": "https://graph.microsoft.com/.default",
+            "expires_in": 3600,
+            "access_token": f"at-{serial}",
+            "refresh_token": f"rt-{serial}",
+            "id_token": id_token,
+            "client_info": _b64({"uid": "uid", "utid": "tid"})
+        }
+
+
+@pytest.fixture
+def token_authority(tmp_path, monkeypatch):
+    """StubAuthority served over HTTPS with a throwaway certificate that requests is told to trust"""
+    pytest.importorskip("msal")
+    stub = StubAuthority()
+
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, status: int, body: Dict):
+            data = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            if "openid-configuration" in self.path:
+                base = stub.authority
+                self._send(200, {
+                    "issuer": f"{base}/v2.0",
+                    "authorization_endpoint": f"{base}/oauth2/v2.0/authorize",
+                    "token_endpoint": f"{base}/oauth2/v2.0/token",
+                    "device_authorization_endpoint": f"{base}/oauth2/v2.0/devicecode"
+                })
+            else:
+                self._send(404, {"error": "not_found"})
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0))).decode("utf-8")
+            form = {k: v[0] for k, v in parse_qs(body).items()}
+            if self.path.endswith("/devicecode"):
+                self._send(200, {
+                    "device_code": "stub-device-code", "user_code": "STUB", "interval": 1, "expires_in": 30,
+                    "verification_uri": "https://example.invalid/devicelogin", "message": "Enter STUB"
+                })
+            elif self.path.endswith("/token"):
+                with stub._lock:
+                    stub.grants.append(form.get("grant_type"))
+                self._send(200, stub.tokens())
+            else:
+                self._send(404, {"error": "not_found"})
+
+        def log_message(self, format, *args):
+            pass
+
+    cert_path, key_path = _self_signed_cert(tmp_path)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(str(cert_path), str(key_path))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    stub.authority = f"https://127.0.0.1:{server.server_address[1]}/common"
+    monkeypatch.setenv("REQUESTS_CA_BUNDLE", str(cert_path))
+    try:
+        yield stub
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,35 @@
+"""
+Context cleaning: join footers are removed, ordinary divider lines are not
+"""
+
+from src.context_builder import ContextBuilder
+
+TEAMS_FOOTER = (
+    "\r\n________________________________________________________________________________\r\n"
+    "Microsoft Teams meeting\r\n"
+    "Join on your computer, mobile app or room device\r\n"
+    "Click here to join the meeting<https://teams.microsoft.com/l/meetup-join/abc>\r\n"
+    "Meeting ID: 123 456 789\r\nPasscode: xyz\r\n"
+)
+
+
+def test_agenda_divider_keeps_content():
+    builder = ContextBuilder(clean=True)
+    description = "Agenda\n--------\n1. Q3 numbers\n2. Hiring plan\n\nThanks,\nAna\n-- \n________\nAna Ruiz, Finance"
+
+    cleaned = builder.clean_description(description)
+
+    assert "Q3 numbers" in cleaned
+    assert "Hiring plan" in cleaned
+    assert "Ana Ruiz, Finance" in cleaned
+    assert builder.stats["footers_removed"] == 0
+
+
+def test_teams_footer_is_removed():
+    builder = ContextBuilder(clean=True)
+    description = "Agenda\n--------\n1. Q3 numbers\n2. Hiring plan" + TEAMS_FOOTER
+
+    cleaned = builder.clean_description(description)
+
+    assert cleaned == "Agenda -------- 1. Q3 numbers 2. Hiring plan"
+    assert builder.stats["footers_removed"] == 1
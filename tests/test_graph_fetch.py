@@ -0,0 +1,68 @@
+"""
+Graph fetching against the stub server: throttling retries and cross-window dedup
+"""
+
+import re
+
+from mimic import MimicTool
+
+
+def _event(event_id: str, start: str = "2026-01-01T10:00:00.0000000") -> dict:
+    return {
+        "id": event_id,
+        "subject": f"Meeting {event_id}",
+        "bodyPreview": "",
+        "start": {"dateTime": start, "timeZone": "UTC"},
+        "end": {"dateTime": start, "timeZone": "UTC"},
+        "attendees": [{}, {}, {}]
+    }
+
+
+def _tool(graph_server) -> MimicTool:
+    tool = MimicTool("me@example.com")
+    tool.graph_endpoint = graph_server.endpoint
+    tool.access_token = "stub-token"
+    return tool
+
+
+def test_graph_get_retries_after_429(graph_server):
+    """Throttled requests are retried after Retry-After until Graph answers"""
+    responses = iter([
+        (429, {"Retry-After": "0"}, None),
+        (429, {"Retry-After": "0"}, None),
+        (200, {}, {"value": [_event("a")]})
+    ])
+    graph_server.respond = lambda path, query: next(responses)
+
+    tool = _tool(graph_server)
+    meetings = tool.fetch_meetings(days=10, workers=1, window_days=10)
+
+    assert [m.id for m in meetings] == ["a"]
+    assert len(graph_server.requests) == 3
+    # The retries repeat the original query
+    assert all(query == graph_server.requests[0][1] for _, query in graph_server.requests)
+
+
+def test_boundary_event_is_fetched_once(graph_server):
+    """An event returned by two windows (and by two pages of one window) is kept once"""
+    boundary = _event("boundary", "2026-01-10T00:00:00.0000000")
+
+    def respond(path, query):
+        if query.get("page") == "2":
+            return 200, {}, {"value": [boundary, _event("late")]}
+        window_start = re.search(r"ge '([^']+)'", query["$filter"]).group(1)
+        page = {"value": [boundary, _event(f"in-{window_start}")]}
+        if query.get("page") is None and len(graph_server.requests) == 1:
+            page["@odata.nextLink"] = f"{graph_server.endpoint}{path[len('/v1.0'):]}?page=2"
+        return 200, {}, page
+
+    graph_server.respond = respond
+
+    tool = _tool(graph_server)
+    meetings = tool.fetch_meetings(days=20, workers=1, window_days=10)
+    ids = [m.id for m in meetings]
+
+    windows, _ = tool._time_windows(20, 10)
+    assert len(windows) == 2
+    assert ids.count("boundary") == 1
+    assert len(ids) == len(set(ids)) == 4
@@ -0,0 +1,49 @@
+"""
+Sign-in against the stub authority: the token cache is private, reused silently and never for another account
+"""
+
+import os
+import stat
+
+import pytest
+
+import mimic
+from mimic import MimicTool
+
+
+def _tool(token_authority, cache_path, email="me@example.com", interactive=True) -> MimicTool:
+    tool = MimicTool(email, token_cache_path=str(cache_path), interactive=interactive)
+    tool.authority = token_authority.authority
+    return tool
+
+
+@pytest.fixture(autouse=True)
+def no_browser(monkeypatch):
+    monkeypatch.setattr(mimic.webbrowser, "open", lambda url: False)
+
+
+def test_second_run_signs_in_silently(token_authority, tmp_path):
+    cache_path = tmp_path / "mimic" / "token_cache.bin"
+
+    first = _tool(token_authority, cache_path)
+    assert first.authenticate()
+    assert token_authority.grants == ["urn:ietf:params:oauth:grant-type:device_code"]
+    assert cache_path.exists()
+    if os.name == "posix":
+        assert stat.S_IMODE(cache_path.stat().st_mode) == 0o600
+
+    second = _tool(token_authority, cache_path, interactive=False)
+    assert second.authenticate()
+    # The cached access token is still valid: no device code, no token request at all
+    assert second.access_token == first.access_token
+    assert len(token_authority.grants) == 1
+
+
+def test_cached_account_of_another_user_is_not_used(token_authority, tmp_path):
+    cache_path = tmp_path / "token_cache.bin"
+    assert _tool(token_authority, cache_path).authenticate()
+
+    other = _tool(token_authority, cache_path, email="someone.else@example.com", interactive=False)
+    assert not other.authenticate()
+    assert other.access_token is None
+    assert len(token_authority.grants) == 1